@@ -6,14 +6,41 @@ import json
 import hashlib
 import datetime
 import os
-from typing import List, Dict, Optional, Any
+import sys
+import mmap
+import struct
+import multiprocessing
+import threading
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import List, Dict, Iterable, Optional, Any, Set, Tuple
 from dataclasses import dataclass, asdict
-from config import BLOCKCHAIN_FILE, DIFFICULTY, MAX_NONCE
+from config import (BLOCKCHAIN_FILE, DIFFICULTY, MAX_NONCE,
+                    POW_WORKERS, POW_BATCH, PARALLEL_VALIDATE_MIN_BLOCKS)
 from log import fs_logger
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # Optional; fall back to the stdlib json module
+    orjson = None
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON with orjson when available."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def _json_dumps_indented(obj: Any) -> bytes:
+    """Serialize JSON with two-space indentation, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+@dataclass(slots=True)
 class Block:
-    """Represents a block in the blockchain."""
+    """
+    Represents a block in the blockchain.
+    
+    Slotted so a long chain does not carry a per-block __dict__.
+    """
     index: int
     timestamp: str
     filename: str
@@ -31,7 +58,222 @@ class Block:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Block':
         """Create block from dictionary."""
-        return cls(**data)
+        block = cls(**data)
+        block.filename = sys.intern(block.filename)
+        return block
+
+# Block log record layout: a length prefix, the numeric fields, then the
+# string fields. Hex digests are stored as 32 raw bytes when they round-trip.
+RECORD_LENGTH = struct.Struct('<I')
+BLOCK_HEADER = struct.Struct('<QQQ')  # index, file_size, nonce
+FIELD_LENGTH = struct.Struct('<H')
+RAW_HASH, TEXT_HASH = 0, 1
+
+def _pack_text(text: str) -> bytes:
+    """Pack a string as a length-prefixed UTF-8 field."""
+    data = text.encode()
+    return FIELD_LENGTH.pack(len(data)) + data
+
+def _unpack_text(payload, offset: int) -> Tuple[str, int]:
+    """Unpack a length-prefixed UTF-8 field, returning it and the next offset."""
+    (length,) = FIELD_LENGTH.unpack_from(payload, offset)
+    offset += FIELD_LENGTH.size
+    return str(payload[offset:offset + length], 'utf-8'), offset + length
+
+def _pack_hash(value: str) -> bytes:
+    """Pack a hex digest as 32 raw bytes, or as text if it is not one."""
+    if len(value) == 64:
+        try:
+            raw = bytes.fromhex(value)
+            if raw.hex() == value:
+                return bytes((RAW_HASH,)) + raw
+        except ValueError:
+            pass
+    return bytes((TEXT_HASH,)) + _pack_text(value)
+
+def _unpack_hash(payload, offset: int) -> Tuple[str, int]:
+    """Unpack a field written by _pack_hash, returning it and the next offset."""
+    if payload[offset] == RAW_HASH:
+        return payload[offset + 1:offset + 33].hex(), offset + 33
+    return _unpack_text(payload, offset + 1)
+
+def encode_block(block: 'Block') -> bytes:
+    """Serialize a block as one length-prefixed log record."""
+    payload = b''.join((
+        BLOCK_HEADER.pack(block.index, block.file_size, block.nonce),
+        _pack_text(block.timestamp),
+        _pack_text(block.filename),
+        _pack_text(block.ipfs_hash),
+        _pack_hash(block.chunk_hash),
+        _pack_hash(block.previous_hash),
+        _pack_hash(block.hash),
+    ))
+    return RECORD_LENGTH.pack(len(payload)) + payload
+
+def _decode_fields(payload) -> Tuple['Block', int]:
+    """Deserialize a block from the start of payload, returning it and where its fields end."""
+    index, file_size, nonce = BLOCK_HEADER.unpack_from(payload)
+    offset = BLOCK_HEADER.size
+    timestamp, offset = _unpack_text(payload, offset)
+    filename, offset = _unpack_text(payload, offset)
+    ipfs_hash, offset = _unpack_text(payload, offset)
+    chunk_hash, offset = _unpack_hash(payload, offset)
+    previous_hash, offset = _unpack_hash(payload, offset)
+    block_hash, offset = _unpack_hash(payload, offset)
+    return Block(index, timestamp, sys.intern(filename), file_size, chunk_hash,
+                 ipfs_hash, previous_hash, nonce, block_hash), offset
+
+def decode_block(payload) -> 'Block':
+    """Deserialize the payload of one log record, which its fields must fill exactly."""
+    block, end = _decode_fields(payload)
+    if end != len(payload):
+        raise ValueError(f"Record for block {block.index} is {len(payload)} bytes but its fields take {end}")
+    return block
+
+def is_torn_record(payload, expected_index: int) -> bool:
+    """
+    Check whether the bytes at the end of the log are a record cut short.
+    
+    An interrupted append leaves the start of the next record, so its
+    header (if present) carries the next index and its fields run past
+    the end of the file. If a complete record is there instead, it is the
+    length prefix in front of it that is corrupt.
+    
+    Args:
+        payload: Everything after the last complete record's length prefix
+        expected_index: Index the next block must have
+    """
+    if len(payload) >= BLOCK_HEADER.size and BLOCK_HEADER.unpack_from(payload)[0] != expected_index:
+        return False
+    try:
+        _, end = _decode_fields(payload)
+    except (struct.error, IndexError, UnicodeDecodeError):
+        return True  # Ran out of data part way through a field
+    return end > len(payload)
+
+def pow_target(difficulty: int) -> bytes:
+    """
+    Build the exclusive upper bound a digest must be below to meet a difficulty.
+    
+    A digest starts with `difficulty` zero hex digits exactly when, read
+    as a big-endian number, it is below 2 ** (256 - 4 * difficulty).
+    Comparing the raw digest against that bound as bytes is a single
+    lexicographic compare with no slicing.
+    """
+    if difficulty <= 0:
+        # Every 32-byte digest sorts before this 33-byte value
+        return b'\xff' * 32 + b'\x00'
+    return (1 << (256 - 4 * difficulty)).to_bytes(32, 'big')
+
+# Precomputed once for the configured DIFFICULTY
+POW_TARGET = pow_target(DIFFICULTY)
+
+def meets_difficulty(digest: bytes) -> bool:
+    """Check a raw digest for the configured leading zero hex digits."""
+    return digest < POW_TARGET
+
+def block_prefix(block: Block) -> bytes:
+    """
+    Serialize every hashed field of a block except the nonce.
+    
+    This text concatenation is the input every stored block hash was
+    computed over, so it cannot become a packed binary layout without
+    invalidating existing chains. Mining builds it once per block.
+    """
+    return (
+        str(block.index) +
+        block.timestamp +
+        block.filename +
+        str(block.file_size) +
+        block.chunk_hash +
+        block.ipfs_hash +
+        block.previous_hash
+    ).encode()
+
+def block_digest(block: Block) -> bytes:
+    """Calculate the raw SHA-256 digest of a block."""
+    return hashlib.sha256(block_prefix(block) + b'%d' % block.nonce).digest()
+
+# ASCII encodings of the last three nonce digits, so a nonce >= 1000 is
+# hashed as its leading digits followed by a table lookup
+NONCE_SUFFIXES = tuple(b'%03d' % low for low in range(1000))
+
+def mine(prefix: bytes, difficulty: int, max_nonce: int,
+         start: int = 0) -> Tuple[int, Optional[bytes]]:
+    """
+    Search for a nonce whose SHA-256 over prefix + nonce meets the difficulty.
+    
+    The prefix is absorbed once into a base hasher. For each run of a
+    thousand nonces the shared leading digits are absorbed once more, and
+    each attempt only feeds a precomputed three-digit suffix into a copy of
+    that midstate, so no integer is converted to text per attempt. The
+    digest is tested on its leading bits directly. hashlib hands the
+    compression rounds to OpenSSL, which uses the CPU's SHA extensions
+    where available.
+    
+    Args:
+        prefix: Serialized block fields preceding the nonce
+        difficulty: Number of leading zero hex digits required
+        max_nonce: Upper bound (exclusive) of the nonce search
+        start: First nonce to try
+        
+    Returns:
+        Tuple of (nonce, digest), or (0, None) if no nonce was found
+    """
+    target = POW_TARGET if difficulty == DIFFICULTY else pow_target(difficulty)
+    base_hasher = hashlib.sha256(prefix)
+    
+    # Nonces below 1000 have no shared leading digits
+    for nonce in range(start, min(max_nonce, 1000)):
+        hasher = base_hasher.copy()
+        hasher.update(b'%d' % nonce)
+        digest = hasher.digest()
+        if digest < target:
+            return nonce, digest
+    
+    for high in range(max(start, 1000) // 1000, -(-max_nonce // 1000)):
+        high_hasher = base_hasher.copy()
+        high_hasher.update(b'%d' % high)
+        base = high * 1000
+        
+        for low in range(max(start - base, 0), min(max_nonce - base, 1000)):
+            hasher = high_hasher.copy()
+            hasher.update(NONCE_SUFFIXES[low])
+            digest = hasher.digest()
+            if digest < target:
+                return base + low, digest
+    
+    return 0, None
+
+# Number of the nonce search in progress, shared with the PoW workers. A
+# worker stops as soon as the search it was given is no longer current.
+_pow_round = None
+
+def _init_pow_worker(pow_round):
+    """Store the shared search counter in a PoW worker process."""
+    global _pow_round
+    _pow_round = pow_round
+
+def _mine_worker(prefix: bytes, difficulty: int, max_nonce: int,
+                 lane: int, lanes: int, round_id: int) -> Tuple[int, Optional[bytes]]:
+    """Scan every lanes-th batch of nonces until one is found or the search ends."""
+    for batch_start in range(lane * POW_BATCH, max_nonce, lanes * POW_BATCH):
+        if _pow_round.value != round_id:
+            break
+        
+        nonce, digest = mine(prefix, difficulty, min(batch_start + POW_BATCH, max_nonce), batch_start)
+        if digest is not None:
+            return nonce, digest
+    
+    return 0, None
+
+def _add_to_index(block: Block, by_filename: Dict[str, List[int]], filenames: Set[str],
+                  ipfs_by_chunk: Dict[str, str]):
+    """Record a block in a set of block indexes."""
+    by_filename[block.filename].append(block.index)
+    if block.filename != "GENESIS":
+        filenames.add(block.filename)
+        ipfs_by_chunk.setdefault(block.chunk_hash, block.ipfs_hash)
 
 class Blockchain:
     """Blockchain for maintaining file integrity."""
@@ -39,7 +281,16 @@ class Blockchain:
     def __init__(self, blockchain_file: str = BLOCKCHAIN_FILE):
         """Initialize blockchain."""
         self.blockchain_file = blockchain_file
+        self.json_file = os.path.splitext(blockchain_file)[0] + '.json'
         self.chain: List[Block] = []
+        self._by_filename: Dict[str, List[int]] = defaultdict(list)  # Filename -> block indices
+        self._filenames: Set[str] = set()  # Stored files, excluding GENESIS
+        self._ipfs_by_chunk: Dict[str, str] = {}  # Chunk hash -> IPFS hash of its first stored copy
+        self.version = 0  # Bumped whenever blocks are indexed, for callers caching derived views
+        self._log_end = 0  # End of the last complete record this instance read or wrote
+        self._lock = threading.RLock()  # Serializes appends and pool setup across FUSE threads
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pow_round = None  # Shared search counter for the pool's workers
         self.load_blockchain()
         
         # Create genesis block if chain is empty
@@ -59,25 +310,21 @@ class Blockchain:
             nonce=0
         )
         genesis_block.hash = self.calculate_hash(genesis_block)
-        self.chain.append(genesis_block)
-        self.save_blockchain()
+        with self._lock:
+            self.chain.append(genesis_block)
+            self._index_block(genesis_block)
+            self.append_blocks([genesis_block])
         
         fs_logger.log_blockchain_operation("GENESIS", "Genesis block created")
         return genesis_block
     
+    def calculate_digest(self, block: Block) -> bytes:
+        """Calculate the raw SHA-256 digest of a block."""
+        return block_digest(block)
+    
     def calculate_hash(self, block: Block) -> str:
         """Calculate SHA-256 hash of a block."""
-        block_string = (
-            str(block.index) +
-            block.timestamp +
-            block.filename +
-            str(block.file_size) +
-            block.chunk_hash +
-            block.ipfs_hash +
-            block.previous_hash +
-            str(block.nonce)
-        )
-        return hashlib.sha256(block_string.encode()).hexdigest()
+        return self.calculate_digest(block).hex()
     
     def proof_of_work(self, block: Block) -> int:
         """
@@ -89,19 +336,80 @@ class Blockchain:
         Returns:
             Valid nonce value
         """
-        target = "0" * DIFFICULTY
+        prefix = block_prefix(block)
         
-        for nonce in range(MAX_NONCE):
-            block.nonce = nonce
-            hash_result = self.calculate_hash(block)
-            
-            if hash_result.startswith(target):
-                fs_logger.log_blockchain_operation("POW", f"Nonce found: {nonce}, Hash: {hash_result}")
-                return nonce
+        if POW_WORKERS > 1:
+            try:
+                nonce, digest = self._parallel_mine(prefix)
+            except Exception as e:
+                fs_logger.log_error("POW", f"Parallel mining failed, falling back to serial: {e}")
+                nonce, digest = mine(prefix, DIFFICULTY, MAX_NONCE)
+        else:
+            nonce, digest = mine(prefix, DIFFICULTY, MAX_NONCE)
+        
+        if digest is not None:
+            fs_logger.log_blockchain_operation("POW", f"Nonce found: {nonce}, Hash: {digest.hex()}")
+            return nonce
         
         fs_logger.log_error("POW", "Max nonce reached without finding valid hash")
         return 0
     
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """
+        Get the worker pool shared by mining and validation, creating it on first use.
+        
+        Workers are spawned rather than forked: the pool is started lazily
+        from the multithreaded FUSE process, and a forked child could
+        inherit locks held by its upload or logging threads.
+        """
+        with self._lock:
+            if self._executor is None:
+                context = multiprocessing.get_context('spawn')
+                self._pow_round = context.Value('Q', 0)
+                self._executor = ProcessPoolExecutor(
+                    max_workers=POW_WORKERS,
+                    mp_context=context,
+                    initializer=_init_pow_worker,
+                    initargs=(self._pow_round,)
+                )
+            return self._executor
+    
+    def close(self):
+        """Shut down the worker pool, if one was started."""
+        with self._lock:
+            if self._executor is not None:
+                self._pow_round.value += 1
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+    
+    def _parallel_mine(self, prefix: bytes) -> Tuple[int, Optional[bytes]]:
+        """
+        Split the nonce search across POW_WORKERS processes.
+        
+        Worker i takes every POW_WORKERS-th batch of POW_BATCH nonces,
+        starting at batch i. The first nonce found is returned straight
+        away; ending the search round makes the other workers stop after
+        their current batch.
+        """
+        executor = self._get_executor()
+        
+        round_id = self._pow_round.value + 1
+        self._pow_round.value = round_id
+        pending = {
+            executor.submit(_mine_worker, prefix, DIFFICULTY, MAX_NONCE, lane, POW_WORKERS, round_id)
+            for lane in range(POW_WORKERS)
+        }
+        
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                found = [result for result in (f.result() for f in done) if result[1] is not None]
+                if found:
+                    return min(found)
+            return 0, None
+        finally:
+            self._pow_round.value = round_id + 1
+    
     def add_block(self, filename: str, file_size: int, chunk_hash: str, ipfs_hash: str) -> Block:
         """
         Add a new block to the blockchain.
@@ -109,55 +417,175 @@ class Blockchain:
         Args:
             filename: Name of the file
             file_size: Size of the file chunk
-            chunk_hash: SHA-256 hash of the chunk
+            chunk_hash: Integrity hash of the chunk
             ipfs_hash: IPFS hash of the stored chunk
             
         Returns:
             The newly created block
         """
-        previous_block = self.get_latest_block()
-        
-        new_block = Block(
-            index=len(self.chain),
-            timestamp=datetime.datetime.now().isoformat(),
-            filename=filename,
-            file_size=file_size,
-            chunk_hash=chunk_hash,
-            ipfs_hash=ipfs_hash,
-            previous_hash=previous_block.hash
-        )
+        return self.add_blocks([(filename, file_size, chunk_hash, ipfs_hash)])[0]
+    
+    def add_blocks(self, entries: Iterable[Tuple[str, int, str, str]]) -> List[Block]:
+        """
+        Add several blocks to the blockchain in one batch.
         
-        # Perform proof of work
-        new_block.nonce = self.proof_of_work(new_block)
-        new_block.hash = self.calculate_hash(new_block)
+        Each block links to the one before it, so blocks are still mined
+        one after another, but the whole batch is written to the block
+        log with a single append. The entries are collected before the
+        chain lock is taken, so an iterable that is slow to produce them
+        never holds up other writers. If producing one fails, no block
+        from the batch is added.
         
-        self.chain.append(new_block)
-        self.save_blockchain()
+        Args:
+            entries: (filename, file_size, chunk_hash, ipfs_hash) per block
+            
+        Returns:
+            The newly created blocks, in chain order
+        """
+        entries = list(entries)
         
-        fs_logger.log_blockchain_operation("ADD_BLOCK", f"Block {new_block.index} added for {filename}")
-        return new_block
+        # Blocks chain onto the latest one, so only one batch is mined at a time
+        with self._lock:
+            start = len(self.chain)
+            new_blocks = []
+            
+            try:
+                for filename, file_size, chunk_hash, ipfs_hash in entries:
+                    previous_block = self.get_latest_block()
+                    
+                    new_block = Block(
+                        index=len(self.chain),
+                        timestamp=datetime.datetime.now().isoformat(),
+                        filename=sys.intern(filename),
+                        file_size=file_size,
+                        chunk_hash=chunk_hash,
+                        ipfs_hash=ipfs_hash,
+                        previous_hash=previous_block.hash
+                    )
+                    
+                    # Perform proof of work
+                    new_block.nonce = self.proof_of_work(new_block)
+                    new_block.hash = self.calculate_hash(new_block)
+                    
+                    self.chain.append(new_block)
+                    self._index_block(new_block)
+                    new_blocks.append(new_block)
+                    
+                    fs_logger.log_blockchain_operation("ADD_BLOCK", f"Block {new_block.index} added for {filename}")
+            except BaseException:
+                # Nothing from this batch has been written yet; forget it,
+                # re-indexing first so no lookup sees an index past the chain
+                self._rebuild_index(self.chain[:start])
+                del self.chain[start:]
+                raise
+            
+            self.append_blocks(new_blocks)
+            return new_blocks
     
     def get_latest_block(self) -> Block:
         """Get the latest block in the chain."""
         return self.chain[-1] if self.chain else None
     
-    def get_file_blocks(self, filename: str) -> List[Block]:
-        """Get all blocks for a specific file."""
-        return [block for block in self.chain if block.filename == filename]
+    def _index_block(self, block: Block):
+        """Record a block in the filename index."""
+        self.version += 1
+        _add_to_index(block, self._by_filename, self._filenames, self._ipfs_by_chunk)
+    
+    def _rebuild_index(self, blocks: Optional[List[Block]] = None):
+        """
+        Rebuild the block indexes after the chain is replaced.
+        
+        The new indexes are built on the side and swapped in, so lookups on
+        other threads see either the old index or the new one, never a
+        partly filled one.
+        
+        Args:
+            blocks: Blocks to index, defaults to the whole chain
+        """
+        by_filename = defaultdict(list)
+        filenames = set()
+        ipfs_by_chunk = {}
+        for block in self.chain if blocks is None else blocks:
+            _add_to_index(block, by_filename, filenames, ipfs_by_chunk)
+        
+        self._by_filename, self._filenames = by_filename, filenames
+        self._ipfs_by_chunk = ipfs_by_chunk
+        self.version += 1
+    
+    def get_file_blocks(self, filename: str) -> Tuple[Block, ...]:
+        """
+        Get all blocks for a specific file.
+        
+        The filename index is filled as blocks are appended, so the blocks
+        are already in index order and callers need not sort them.
+        """
+        chain = self.chain
+        return tuple(chain[i] for i in self._by_filename.get(filename, ()))
+    
+    def get_filenames(self) -> List[str]:
+        """Get the names of all files stored in the blockchain."""
+        return list(self._filenames)
+    
+    def has_file(self, filename: str) -> bool:
+        """Check whether any version of a file is stored in the blockchain."""
+        return filename in self._filenames
+    
+    def get_chunk_ipfs_hash(self, chunk_hash: str) -> Optional[str]:
+        """
+        Get the IPFS hash of a chunk already stored in the chain.
+        
+        Args:
+            chunk_hash: Hash of the chunk contents
+            
+        Returns:
+            IPFS hash of the stored copy, or None if the chunk is not stored
+        """
+        return self._ipfs_by_chunk.get(chunk_hash)
+    
+    def _chain_digests(self, chain: List[Block]) -> List[bytes]:
+        """
+        Recompute the digest of every block in a chain.
+        
+        Digests always come from the blocks' current contents, so a block
+        changed after an earlier validation is still caught. Each digest is
+        independent of the others, so a long chain is hashed on the worker
+        pool; short ones stay in-process where pickling the blocks would
+        cost more than the hashing.
+        """
+        if POW_WORKERS > 1 and len(chain) >= PARALLEL_VALIDATE_MIN_BLOCKS:
+            try:
+                chunksize = -(-len(chain) // POW_WORKERS)
+                return list(self._get_executor().map(block_digest, chain, chunksize=chunksize))
+            except Exception as e:
+                fs_logger.log_error("VALIDATE", f"Parallel hashing failed, falling back to serial: {e}")
+        
+        return [block_digest(block) for block in chain]
+    
+    def verify_block(self, block: Block) -> bool:
+        """Check that a block's stored hash matches its contents."""
+        return block.hash == self.calculate_hash(block)
     
     def validate_chain(self) -> bool:
         """
         Validate the entire blockchain.
         
+        Block digests are recomputed up front (in parallel for long chains),
+        then a cheap serial pass checks hashes, links and proof of work in
+        order.
+        
         Returns:
             True if chain is valid, False otherwise
         """
-        for i in range(1, len(self.chain)):
-            current_block = self.chain[i]
-            previous_block = self.chain[i - 1]
+        chain = list(self.chain)  # Blocks appended meanwhile are left for the next check
+        digests = self._chain_digests(chain)
+        
+        for i in range(1, len(chain)):
+            current_block = chain[i]
+            previous_block = chain[i - 1]
+            digest = digests[i]
             
             # Check if current block's hash is valid
-            if current_block.hash != self.calculate_hash(current_block):
+            if current_block.hash != digest.hex():
                 fs_logger.log_error("VALIDATE", f"Invalid hash at block {i}")
                 return False
             
@@ -167,7 +595,7 @@ class Blockchain:
                 return False
             
             # Check proof of work
-            if not current_block.hash.startswith("0" * DIFFICULTY):
+            if not meets_difficulty(digest):
                 fs_logger.log_error("VALIDATE", f"Invalid proof of work at block {i}")
                 return False
         
@@ -178,6 +606,9 @@ class Blockchain:
         """
         Detect tampering in blocks for a specific file.
         
+        Every block is re-hashed from its current contents, however often
+        it has been checked before.
+        
         Args:
             filename: Name of the file to check
             
@@ -188,47 +619,152 @@ class Blockchain:
         file_blocks = self.get_file_blocks(filename)
         
         for block in file_blocks:
-            if block.hash != self.calculate_hash(block):
+            if not self.verify_block(block):
                 tampered_blocks.append(block.index)
                 fs_logger.log_tamper_detected(filename, block.index)
         
         return tampered_blocks
     
     def save_blockchain(self):
-        """Save blockchain to file."""
+        """Rewrite the whole block log from the in-memory chain."""
         try:
-            blockchain_data = {
-                'chain': [block.to_dict() for block in self.chain],
-                'length': len(self.chain)
-            }
-            
-            with open(self.blockchain_file, 'w') as f:
-                json.dump(blockchain_data, f, indent=2)
+            data = b''.join(encode_block(block) for block in self.chain)
+            with open(self.blockchain_file, 'wb') as f:
+                f.write(data)
+            self._log_end = len(data)
+                
+        except Exception as e:
+            fs_logger.log_error("SAVE_BLOCKCHAIN", str(e))
+    
+    def append_blocks(self, blocks: List[Block]):
+        """
+        Append block records to the log in a single write.
+        
+        Readers leave a partial trailing record in place, since it may
+        still be being written. The appending instance is the one that
+        repairs it: anything past the last complete record it knows about
+        is cut off before the new records are written. Callers hold
+        self._lock.
+        """
+        if not blocks:
+            return
+        
+        try:
+            data = b''.join(encode_block(block) for block in blocks)
+            with open(self.blockchain_file, 'ab') as f:
+                size = f.seek(0, os.SEEK_END)
+                if size > self._log_end:
+                    fs_logger.log_error("SAVE_BLOCKCHAIN", f"Dropping partial record at offset {self._log_end}")
+                    f.truncate(self._log_end)
+                f.write(data)
+            self._log_end += len(data)
                 
         except Exception as e:
             fs_logger.log_error("SAVE_BLOCKCHAIN", str(e))
     
+    def _read_log(self) -> List[Block]:
+        """
+        Decode block records out of a read-only memory map of the log, so
+        the file is never copied into one large bytes object. Each record
+        is sliced out as its own small bytes object rather than a view, so
+        a decoding error propagates without pinning the map open.
+        
+        Reading stops at a partially written record at the very end of the
+        file, which may be an append still in progress in another process
+        or one cut short by a crash. The file itself is never modified
+        here; append_blocks repairs the tail in the instance that writes to
+        the log. Anything else that does not decode is corruption and
+        raises ValueError.
+        """
+        chain = []
+        valid_end = 0
+        
+        with open(self.blockchain_file, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                self._log_end = 0
+                return chain
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                while valid_end + RECORD_LENGTH.size <= size:
+                    (length,) = RECORD_LENGTH.unpack_from(mm, valid_end)
+                    start = valid_end + RECORD_LENGTH.size
+                    if start + length > size:
+                        if not is_torn_record(mm[start:size], len(chain)):
+                            raise ValueError(f"Corrupt record length at offset {valid_end}")
+                        break
+                    block = decode_block(mm[start:start + length])
+                    if block.index != len(chain):
+                        raise ValueError(f"Expected block {len(chain)} at offset {valid_end}, found {block.index}")
+                    chain.append(block)
+                    valid_end = start + length
+        
+        if valid_end != size:
+            fs_logger.log_error("LOAD_BLOCKCHAIN", f"Ignoring partial record at offset {valid_end}")
+        
+        self._log_end = valid_end
+        return chain
+    
     def load_blockchain(self):
-        """Load blockchain from file."""
+        """
+        Load blockchain from the block log, importing a legacy JSON file if needed.
+        
+        A log that fails to load is left untouched and the error is raised,
+        rather than starting a fresh chain that would be saved over it.
+        """
         try:
             if os.path.exists(self.blockchain_file):
-                with open(self.blockchain_file, 'r') as f:
-                    blockchain_data = json.load(f)
+                self.chain = self._read_log()
+                fs_logger.log_blockchain_operation("LOAD", f"Loaded {len(self.chain)} blocks")
+            
+            elif os.path.exists(self.json_file) and os.path.getsize(self.json_file) > 0:
+                with open(self.json_file, 'rb') as f:
+                    blockchain_data = _json_loads(f.read())
                 
                 self.chain = [Block.from_dict(block_data) for block_data in blockchain_data['chain']]
-                fs_logger.log_blockchain_operation("LOAD", f"Loaded {len(self.chain)} blocks")
+                self.save_blockchain()
+                fs_logger.log_blockchain_operation("LOAD", f"Imported {len(self.chain)} blocks from {self.json_file}")
             
         except Exception as e:
             fs_logger.log_error("LOAD_BLOCKCHAIN", str(e))
-            self.chain = []
+            raise
+        
+        self._rebuild_index()
     
-    def get_blockchain_info(self) -> Dict[str, Any]:
-        """Get blockchain information."""
+    def export_json(self, path: Optional[str] = None) -> str:
+        """
+        Write the chain as human-readable JSON for debugging.
+        
+        Args:
+            path: Output file, defaults to the JSON sibling of the block log
+            
+        Returns:
+            Path of the written file
+        """
+        path = path or self.json_file
+        blockchain_data = {
+            'chain': [block.to_dict() for block in self.chain],
+            'length': len(self.chain)
+        }
+        
+        with open(path, 'wb') as f:
+            f.write(_json_dumps_indented(blockchain_data))
+        
+        return path
+    
+    def get_blockchain_info(self, validate: bool = False) -> Dict[str, Any]:
+        """
+        Get blockchain information.
+        
+        Args:
+            validate: Re-hash the whole chain to fill in 'is_valid'. Left
+                as None otherwise so a plain info query stays cheap.
+        """
         return {
             'total_blocks': len(self.chain),
             'latest_block_hash': self.get_latest_block().hash if self.chain else None,
-            'is_valid': self.validate_chain(),
-            'files': list(set(block.filename for block in self.chain if block.filename != "GENESIS"))
+            'is_valid': self.validate_chain() if validate else None,
+            'files': self.get_filenames()
         }
     
     def print_blockchain(self):
@@ -250,5 +786,18 @@ class Blockchain:
         
         print("\n" + "="*80)
 
-# Global blockchain instance
-blockchain = Blockchain()
+# Global blockchain instance, created on first use
+_blockchain: Optional[Blockchain] = None
+
+def get_blockchain() -> Blockchain:
+    """Get the global blockchain, loading it on first use."""
+    global _blockchain
+    if _blockchain is None:
+        _blockchain = Blockchain()
+    return _blockchain
+
+def __getattr__(name: str):
+    """Keep `from blockchain import blockchain` working without loading at import time."""
+    if name == 'blockchain':
+        return get_blockchain()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,16 +8,30 @@ import os
 IPFS_HOST = 'localhost'
 IPFS_PORT = 5001
 IPFS_API_URL = '/ip4/127.0.0.1/tcp/5001'
+IPFS_DOWNLOAD_WORKERS = 32  # Concurrent chunk downloads for batch reads
+IPFS_UPLOAD_WORKERS = 8  # Concurrent chunk uploads for multi-chunk writes
+IPFS_UPLOAD_BATCH = 8  # Most chunks sent in one multipart add request
 
 # File System Configuration
-CHUNK_SIZE = 1024  # 1KB chunks
+CHUNK_SIZE = int(os.environ.get('MYFUSE_CHUNK_SIZE', 256 * 1024))  # 256KB chunks (kubo's block size); MYFUSE_CHUNK_SIZE overrides
+CHUNK_HASH_ALGO = 'blake3'  # Chunk integrity hash: 'blake3' (if installed) or 'sha256'
+CHUNK_CACHE_BYTES = 128 << 20  # Verified chunk data kept in memory for repeat reads (0 disables)
+READ_AHEAD_BYTES = 8 << 20  # Data prefetched into the chunk cache past a sequential read (0 disables)
+TAMPER_RECHECK_SECONDS = 600  # Interval between background tampering checks of every stored file (0 disables)
 MOUNT_POINT = './mountpoint'
-BLOCKCHAIN_FILE = './blockchain.json'
+FUSE_MAX_IO = 1 << 20  # Largest kernel read/write/readahead request (big_writes, max_read, ...)
+BLOCKCHAIN_FILE = './blockchain.bin'  # Append-only block log; legacy ./blockchain.json is imported once
 LOG_FILE = './logs.txt'
+LOG_MAX_BYTES = 10 << 20  # Rotate the log file once it reaches 10MB
+LOG_BACKUP_COUNT = 5  # Number of rotated log files to keep
 
 # Blockchain Configuration
 DIFFICULTY = 3  # Number of leading zeros for PoW
 MAX_NONCE = 1000000  # Maximum nonce value for PoW
+POW_WORKERS = int(os.environ.get('MYFUSE_POW_WORKERS', 1))  # Worker processes for nonce search (1 = serial; faster at DIFFICULTY 3)
+POW_BATCH = 256  # Nonces each worker tries between checks for a finished search
+PARALLEL_VALIDATE_MIN_BLOCKS = 512  # Chain length before validation uses the worker pool
+HASH_WORKERS = os.cpu_count() or 1  # Threads for batched chunk hashing
 
 # File System Permissions
 DEFAULT_FILE_MODE = 0o644
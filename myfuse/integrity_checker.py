@@ -4,17 +4,24 @@ CLI utility for verifying blockchain integrity and file verification.
 
 import argparse
 import sys
-from blockchain import blockchain
-from ipfs_client import ipfs_client
+from blockchain import get_blockchain
+from ipfs_client import get_ipfs_client
 from log import fs_logger
 
+# Chunks summarized per progress line when verifying a file
+VERIFY_REPORT_EVERY = 64
+
 class IntegrityChecker:
     """Utility for checking blockchain and file integrity."""
     
     def __init__(self):
         """Initialize the integrity checker."""
-        self.blockchain = blockchain
-        self.ipfs_client = ipfs_client
+        self.blockchain = get_blockchain()
+    
+    @property
+    def ipfs_client(self):
+        """IPFS client, connected only by commands that download chunks."""
+        return get_ipfs_client()
     
     def verify_blockchain(self) -> bool:
         """Verify the entire blockchain integrity."""
@@ -53,34 +60,42 @@ class IntegrityChecker:
             print(f"❌ File '{filename}' not found in blockchain")
             return False
         
-        # Sort blocks by index
-        file_blocks.sort(key=lambda b: b.index)
-        
         # Check for tampering
         tampered_blocks = self.blockchain.detect_tampering(filename)
         if tampered_blocks:
             print(f"❌ Tampering detected in blocks: {tampered_blocks}")
             return False
         
-        # Verify each chunk in IPFS
+        # Download every chunk from IPFS, then verify them as one batch
         total_chunks = len(file_blocks)
         verified_chunks = 0
         
-        for i, block in enumerate(file_blocks):
-            print(f"   Verifying chunk {i+1}/{total_chunks}...", end=" ")
+        chunks = self.ipfs_client.download_chunks([block.ipfs_hash for block in file_blocks])
+        downloaded = [i for i, chunk_data in enumerate(chunks) if chunk_data is not None]
+        results = dict(zip(downloaded, self.ipfs_client.verify_chunks(
+            [chunks[i] for i in downloaded],
+            [file_blocks[i].chunk_hash for i in downloaded]
+        )))
+        
+        # Report failed chunks individually and the rest as one line per
+        # VERIFY_REPORT_EVERY chunks, written out in a single call
+        lines = []
+        for start in range(0, total_chunks, VERIFY_REPORT_EVERY):
+            end = min(start + VERIFY_REPORT_EVERY, total_chunks)
+            passed = 0
+            for i in range(start, end):
+                if i not in results:
+                    lines.append(f"   Chunk {i+1}/{total_chunks}: ❌ Failed to download from IPFS")
+                elif results[i]:
+                    passed += 1
+                else:
+                    lines.append(f"   Chunk {i+1}/{total_chunks}: ❌ Hash mismatch")
             
-            # Download chunk from IPFS
-            chunk_data = self.ipfs_client.download_chunk(block.ipfs_hash)
-            if chunk_data is None:
-                print("❌ Failed to download from IPFS")
-                continue
-            
-            # Verify chunk hash
-            if self.ipfs_client.verify_chunk(chunk_data, block.chunk_hash):
-                print("✅")
-                verified_chunks += 1
-            else:
-                print("❌ Hash mismatch")
+            status = "✅" if passed == end - start else "❌"
+            lines.append(f"   Chunks {start+1}-{end}/{total_chunks}: {passed}/{end - start} verified {status}")
+            verified_chunks += passed
+        
+        print("\n".join(lines))
         
         success = verified_chunks == total_chunks
         
@@ -99,10 +114,7 @@ class IntegrityChecker:
         """List all files in the blockchain."""
         print("Files in blockchain:")
         
-        files = set()
-        for block in self.blockchain.chain:
-            if block.filename != "GENESIS":
-                files.add(block.filename)
+        files = self.blockchain.get_filenames()
         
         if not files:
             print("   No files found")
@@ -117,13 +129,16 @@ class IntegrityChecker:
             print(f"      Size: {total_size} bytes")
             print(f"      Chunks: {chunk_count}")
     
-    def show_blockchain_info(self):
-        """Show blockchain information."""
-        info = self.blockchain.get_blockchain_info()
+    def show_blockchain_info(self, validate: bool = False):
+        """Show blockchain information, validating the chain only if asked."""
+        info = self.blockchain.get_blockchain_info(validate=validate)
         
         print("Blockchain Information:")
         print(f"   Total blocks: {info['total_blocks']}")
-        print(f"   Is valid: {'✅' if info['is_valid'] else '❌'}")
+        if info['is_valid'] is None:
+            print("   Is valid: not checked (run verify-blockchain)")
+        else:
+            print(f"   Is valid: {'✅' if info['is_valid'] else '❌'}")
         print(f"   Files: {len(info['files'])}")
         
         if info['latest_block_hash']:
@@ -132,6 +147,11 @@ class IntegrityChecker:
     def print_blockchain(self):
         """Print the entire blockchain."""
         self.blockchain.print_blockchain()
+    
+    def export_json(self, path=None):
+        """Export the blockchain as JSON for debugging."""
+        path = self.blockchain.export_json(path)
+        print(f"✅ Exported {len(self.blockchain.chain)} blocks to {path}")
 
 def main():
     """Main CLI function."""
@@ -141,7 +161,8 @@ def main():
     
     parser.add_argument(
         'command',
-        choices=['verify-blockchain', 'verify-file', 'list-files', 'info', 'print-blockchain'],
+        choices=['verify-blockchain', 'verify-file', 'list-files', 'info', 'print-blockchain',
+                 'export-json'],
         help='Command to execute'
     )
     
@@ -151,10 +172,16 @@ def main():
         help='Filename for file-specific operations'
     )
     
+    parser.add_argument(
+        '--output',
+        type=str,
+        help='Output path for export-json (defaults to blockchain.json)'
+    )
+    
     args = parser.parse_args()
     
     # Check IPFS connection for operations that need it
-    if args.command in ['verify-file'] and not ipfs_client.is_connected():
+    if args.command in ['verify-file'] and not get_ipfs_client().is_connected():
         print("❌ Error: IPFS daemon is not running. Please start IPFS first.")
         print("Run: ipfs daemon")
         sys.exit(1)
@@ -181,6 +208,9 @@ def main():
         
         elif args.command == 'print-blockchain':
             checker.print_blockchain()
+        
+        elif args.command == 'export-json':
+            checker.export_json(args.output)
     
     except KeyboardInterrupt:
         print("\n❌ Operation cancelled by user")
@@ -4,10 +4,138 @@ IPFS client for uploading and downloading file chunks.
 
 import ipfshttpclient
 import hashlib
-from typing import Optional
-from config import IPFS_API_URL
+import hmac
+import io
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+from config import (IPFS_API_URL, IPFS_DOWNLOAD_WORKERS, IPFS_UPLOAD_WORKERS, IPFS_UPLOAD_BATCH,
+                    HASH_WORKERS, CHUNK_HASH_ALGO)
 from log import fs_logger
 
+try:
+    from blake3 import blake3
+except ImportError:  # Optional; chunk hashes fall back to SHA-256
+    blake3 = None
+
+# hashlib releases the GIL while hashing inputs at least this large
+HASHLIB_GIL_MINSIZE = 2048
+
+# Chunk hashes made with BLAKE3 carry this tag; untagged hashes are SHA-256
+BLAKE3_PREFIX = 'blake3:'
+
+def _sha256_hex(data: bytes) -> str:
+    """Hex SHA-256 of a single buffer."""
+    return hashlib.sha256(data).hexdigest()
+
+def _blake3_tagged(data: bytes) -> str:
+    """Tagged BLAKE3 hex digest of a single buffer."""
+    return BLAKE3_PREFIX + blake3(data).hexdigest()
+
+# Chunk hash function, picked once at import rather than on every call
+_chunk_hash_fn = _blake3_tagged if blake3 is not None and CHUNK_HASH_ALGO == 'blake3' else _sha256_hex
+
+def chunk_digest(chunk_data: bytes) -> str:
+    """
+    Compute the integrity hash stored in a block's chunk_hash.
+    
+    Chunk hashes only need to catch corruption, not resist a PoW-style
+    search, so BLAKE3 is used when available. Its hashes are tagged so
+    older SHA-256 chunk hashes still verify. Block hashes stay SHA-256.
+    """
+    return _chunk_hash_fn(chunk_data)
+
+def _hash_many(hash_fn: Callable[[bytes], str], chunks: List[bytes]) -> List[str]:
+    """
+    Apply a hash function to many independent chunks.
+    
+    Both hashlib and BLAKE3 drop the GIL on large buffers, so when every
+    chunk is big enough they are hashed on HASH_WORKERS threads in
+    parallel; smaller chunks are hashed in a single tight loop where
+    threads would only add overhead.
+    """
+    if HASH_WORKERS > 1 and len(chunks) > 1 and min(map(len, chunks)) >= HASHLIB_GIL_MINSIZE:
+        with ThreadPoolExecutor(max_workers=HASH_WORKERS) as pool:
+            return list(pool.map(hash_fn, chunks))
+    
+    return [hash_fn(chunk) for chunk in chunks]
+
+def sha256_many(chunks: List[bytes]) -> List[str]:
+    """
+    Hash many independent chunks with SHA-256 in one call.
+    
+    Args:
+        chunks: Chunk data to hash
+        
+    Returns:
+        SHA-256 hex digests in the same order as the chunks
+    """
+    return _hash_many(_sha256_hex, chunks)
+
+def chunk_digests(chunks: List[bytes]) -> List[str]:
+    """
+    Compute chunk_digest for every chunk of a write in one call.
+    
+    Args:
+        chunks: Chunk data to hash
+        
+    Returns:
+        Chunk hashes in the same order as the chunks
+    """
+    if len(chunks) == 1:
+        return [_chunk_hash_fn(chunks[0])]
+    return _hash_many(_chunk_hash_fn, chunks)
+
+class ChunkCache:
+    """
+    Byte-bounded LRU cache of verified chunk data.
+    
+    Entries are keyed by (ipfs_hash, chunk_hash) and only added after the
+    data has been verified against that chunk hash, so a hit can be used
+    without downloading or hashing the chunk again.
+    """
+    
+    def __init__(self, max_bytes: int):
+        """Initialize an empty cache holding at most max_bytes of chunk data."""
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries: 'OrderedDict[Tuple[str, str], bytes]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, ipfs_hash: str, chunk_hash: str) -> Optional[bytes]:
+        """Get cached chunk data, marking it most recently used."""
+        key = (ipfs_hash, chunk_hash)
+        with self._lock:
+            chunk_data = self._entries.get(key)
+            if chunk_data is not None:
+                self._entries.move_to_end(key)
+            return chunk_data
+    
+    def put(self, ipfs_hash: str, chunk_hash: str, chunk_data: bytes):
+        """Add verified chunk data, evicting least recently used chunks to fit."""
+        if len(chunk_data) > self.max_bytes:
+            return
+        
+        key = (ipfs_hash, chunk_hash)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= len(old)
+            
+            self._entries[key] = chunk_data
+            self.current_bytes += len(chunk_data)
+            
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= len(evicted)
+    
+    def clear(self):
+        """Drop all cached chunks."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
 class IPFSClient:
     """Client for interacting with IPFS."""
     
@@ -20,7 +148,10 @@ class IPFSClient:
     def connect(self) -> bool:
         """Connect to IPFS daemon."""
         try:
-            self.client = ipfshttpclient.connect(self.api_url)
+            # A persistent session keeps HTTP connections to the daemon
+            # alive instead of opening a new one for every chunk
+            self.client = ipfshttpclient.connect(self.api_url, session=True)
+            self._widen_connection_pool()
             # Test connection
             self.client.version()
             fs_logger.log_blockchain_operation("IPFS_CONNECT", f"Connected to {self.api_url}")
@@ -29,12 +160,32 @@ class IPFSClient:
             fs_logger.log_error("IPFS_CONNECT", str(e))
             return False
     
+    def _widen_connection_pool(self):
+        """
+        Size the session's keep-alive pool for the transfer thread pools.
+        
+        requests keeps at most 10 idle connections per host by default, so
+        with more concurrent transfers than that, extra connections are
+        opened and thrown away after each chunk instead of being reused.
+        """
+        session = getattr(getattr(self.client, '_client', None), '_session', None)
+        if session is None or not session.adapters:
+            return
+        
+        # Reuse the client's own adapter class, which handles its address
+        # family URL schemes, and mount one pooled instance everywhere
+        pool_size = max(IPFS_DOWNLOAD_WORKERS, IPFS_UPLOAD_WORKERS)
+        adapter_cls = type(next(iter(session.adapters.values())))
+        adapter = adapter_cls(pool_maxsize=pool_size)
+        for prefix in list(session.adapters):
+            session.mount(prefix, adapter)
+    
     def upload_chunk(self, chunk_data: bytes) -> Optional[str]:
         """
         Upload a chunk to IPFS and return the hash.
         
         Args:
-            chunk_data: The chunk data to upload
+            chunk_data: The chunk data to upload (bytes or a memoryview)
             
         Returns:
             IPFS hash of the uploaded chunk or None if failed
@@ -44,7 +195,10 @@ class IPFSClient:
                 if not self.connect():
                     return None
             
-            # Upload chunk to IPFS
+            # Upload chunk to IPFS. add_bytes() treats anything other than
+            # bytes as an iterable of byte strings, so wrap buffer views.
+            if not isinstance(chunk_data, bytes):
+                chunk_data = (chunk_data,)
             result = self.client.add_bytes(chunk_data)
             ipfs_hash = result
             
@@ -55,6 +209,67 @@ class IPFSClient:
             fs_logger.log_error("IPFS_UPLOAD", str(e))
             return None
     
+    def upload_batch(self, chunks: List[bytes]) -> List[Optional[str]]:
+        """
+        Upload several chunks in a single multipart add request.
+        
+        Args:
+            chunks: Chunk data to upload (bytes or memoryviews)
+            
+        Returns:
+            IPFS hashes in the same order, or all None if the request failed
+        """
+        if len(chunks) == 1:
+            return [self.upload_chunk(chunks[0])]
+        
+        try:
+            if not self.client:
+                if not self.connect():
+                    return [None] * len(chunks)
+            
+            # The daemon answers with one entry per file, in request order
+            results = self.client.add(*(io.BytesIO(chunk) for chunk in chunks))
+            if len(results) != len(chunks):
+                raise ValueError(f"Expected {len(chunks)} hashes, got {len(results)}")
+            
+            ipfs_hashes = [result['Hash'] for result in results]
+            for ipfs_hash in ipfs_hashes:
+                fs_logger.log_blockchain_operation("IPFS_UPLOAD", f"Chunk uploaded: {ipfs_hash}")
+            return ipfs_hashes
+            
+        except Exception as e:
+            fs_logger.log_error("IPFS_UPLOAD", str(e))
+            return [None] * len(chunks)
+    
+    def upload_chunks(self, chunks: List[bytes]) -> List[Optional[str]]:
+        """
+        Upload many chunks concurrently.
+        
+        Chunks are grouped into multipart requests, batched so that every
+        worker gets a request before any request carries more than
+        IPFS_UPLOAD_BATCH chunks, and issued from up to
+        IPFS_UPLOAD_WORKERS threads at once.
+        
+        Args:
+            chunks: Chunk data to upload
+            
+        Returns:
+            IPFS hashes in the same order, with None for failed uploads
+        """
+        if len(chunks) <= 1:
+            return [self.upload_chunk(chunk) for chunk in chunks]
+        
+        # Connect once up front rather than racing to connect from every thread
+        if not self.client and not self.connect():
+            return [None] * len(chunks)
+        
+        batch_size = max(1, min(IPFS_UPLOAD_BATCH, len(chunks) // IPFS_UPLOAD_WORKERS))
+        batches = [chunks[i:i + batch_size] for i in range(0, len(chunks), batch_size)]
+        
+        with ThreadPoolExecutor(max_workers=min(IPFS_UPLOAD_WORKERS, len(batches))) as pool:
+            return [ipfs_hash for batch_hashes in pool.map(self.upload_batch, batches)
+                    for ipfs_hash in batch_hashes]
+    
     def download_chunk(self, ipfs_hash: str) -> Optional[bytes]:
         """
         Download a chunk from IPFS using its hash.
@@ -80,20 +295,82 @@ class IPFSClient:
             fs_logger.log_error("IPFS_DOWNLOAD", str(e))
             return None
     
+    def download_chunks(self, ipfs_hashes: List[str]) -> List[Optional[bytes]]:
+        """
+        Download many chunks concurrently.
+        
+        Each download is a blocking HTTP round trip, so they are issued from
+        up to IPFS_DOWNLOAD_WORKERS threads at once.
+        
+        Args:
+            ipfs_hashes: IPFS hashes of the chunks
+            
+        Returns:
+            Chunk data in the same order, with None for failed downloads
+        """
+        if len(ipfs_hashes) <= 1:
+            return [self.download_chunk(ipfs_hash) for ipfs_hash in ipfs_hashes]
+        
+        # Connect once up front rather than racing to connect from every thread
+        if not self.client and not self.connect():
+            return [None] * len(ipfs_hashes)
+        
+        with ThreadPoolExecutor(max_workers=min(IPFS_DOWNLOAD_WORKERS, len(ipfs_hashes))) as pool:
+            return list(pool.map(self.download_chunk, ipfs_hashes))
+    
     def verify_chunk(self, chunk_data: bytes, expected_hash: str) -> bool:
         """
-        Verify chunk integrity by comparing SHA-256 hashes.
+        Verify chunk integrity by comparing chunk hashes.
         
         Args:
             chunk_data: The chunk data to verify
-            expected_hash: Expected SHA-256 hash
+            expected_hash: Expected chunk hash (SHA-256, or tagged BLAKE3)
             
         Returns:
             True if chunk is valid, False otherwise
         """
+        if expected_hash.startswith(BLAKE3_PREFIX):
+            if blake3 is None:
+                fs_logger.log_error("VERIFY", "blake3 is not installed; cannot check BLAKE3 chunk hash")
+                return False
+            return BLAKE3_PREFIX + blake3(chunk_data).hexdigest() == expected_hash
+        
         actual_hash = hashlib.sha256(chunk_data).hexdigest()
         return actual_hash == expected_hash
     
+    def verify_chunks(self, chunks: List[bytes], expected_hashes: List[str]) -> List[bool]:
+        """
+        Verify a batch of chunks against their expected chunk hashes.
+        
+        Chunks are grouped by hash algorithm and each group is hashed in
+        one batch, then compared in constant time.
+        
+        Args:
+            chunks: Chunk data to verify
+            expected_hashes: Expected chunk hash of each chunk
+            
+        Returns:
+            Per-chunk verification results, in order
+        """
+        results = [False] * len(chunks)
+        sha256_positions = []
+        blake3_positions = []
+        
+        for i, expected_hash in enumerate(expected_hashes):
+            if not expected_hash.startswith(BLAKE3_PREFIX):
+                sha256_positions.append(i)
+            elif blake3 is not None:
+                blake3_positions.append(i)
+            else:
+                results[i] = self.verify_chunk(chunks[i], expected_hash)  # Logs the missing module
+        
+        for hash_fn, positions in ((_sha256_hex, sha256_positions), (_blake3_tagged, blake3_positions)):
+            actual_hashes = _hash_many(hash_fn, [chunks[i] for i in positions])
+            for i, actual_hash in zip(positions, actual_hashes):
+                results[i] = hmac.compare_digest(actual_hash, expected_hashes[i])
+        
+        return results
+    
     def is_connected(self) -> bool:
         """Check if connected to IPFS."""
         try:
@@ -104,5 +381,18 @@ class IPFSClient:
             pass
         return False
 
-# Global IPFS client instance
-ipfs_client = IPFSClient()
+# Global IPFS client instance, connected on first use
+_ipfs_client: Optional[IPFSClient] = None
+
+def get_ipfs_client() -> IPFSClient:
+    """Get the global IPFS client, connecting on first use."""
+    global _ipfs_client
+    if _ipfs_client is None:
+        _ipfs_client = IPFSClient()
+    return _ipfs_client
+
+def __getattr__(name: str):
+    """Keep `from ipfs_client import ipfs_client` working without connecting at import time."""
+    if name == 'ipfs_client':
+        return get_ipfs_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,10 +2,13 @@
 Logging system for the blockchain-backed FUSE filesystem.
 """
 
+import atexit
 import logging
+import queue
 import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
-from config import LOG_FILE
+from config import LOG_FILE, LOG_MAX_BYTES, LOG_BACKUP_COUNT
 
 class FileSystemLogger:
     """Logger for file system operations."""
@@ -16,14 +19,35 @@ class FileSystemLogger:
         self.setup_logger()
     
     def setup_logger(self):
-        """Set up the logging configuration."""
+        """
+        Set up the logging configuration.
+        
+        Callers (including FUSE operations) only enqueue records; a
+        background listener thread formats them and writes them to the
+        rotating log file, echoing warnings and errors to the console.
+        """
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        file_handler = RotatingFileHandler(
+            self.log_file,
+            maxBytes=LOG_MAX_BYTES,
+            backupCount=LOG_BACKUP_COUNT
+        )
+        # Only warnings and errors are echoed to the console
+        stream_handler = logging.StreamHandler()
+        stream_handler.setLevel(logging.WARNING)
+        for handler in (file_handler, stream_handler):
+            handler.setFormatter(formatter)
+        
+        self.log_queue = queue.Queue()
+        self.listener = QueueListener(self.log_queue, file_handler, stream_handler,
+                                      respect_handler_level=True)
+        self.listener.start()
+        atexit.register(self.listener.stop)
+        
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(self.log_file),
-                logging.StreamHandler()
-            ]
+            format='%(message)s',
+            handlers=[QueueHandler(self.log_queue)]
         )
         self.logger = logging.getLogger(__name__)
     
@@ -5,65 +5,124 @@ Main FUSE filesystem implementation for blockchain-backed storage.
 import os
 import sys
 import errno
-import hashlib
-from typing import Dict, List, Optional
+import threading
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Dict, List, Optional, Set, Tuple
 from fuse import FUSE, FuseOSError, Operations
-from config import CHUNK_SIZE, MOUNT_POINT, DEFAULT_FILE_MODE, DEFAULT_DIR_MODE
-from blockchain import blockchain
-from ipfs_client import ipfs_client
+from config import (CHUNK_SIZE, CHUNK_CACHE_BYTES, READ_AHEAD_BYTES, TAMPER_RECHECK_SECONDS,
+                    MOUNT_POINT, FUSE_MAX_IO, DEFAULT_FILE_MODE, DEFAULT_DIR_MODE)
+from blockchain import get_blockchain
+from ipfs_client import ChunkCache, get_ipfs_client, chunk_digests
 from log import fs_logger
 
+# Root directory attributes never change, so one dict is shared by every
+# getattr('/') call (fusepy only reads it)
+_ROOT_ATTR = {
+    'st_mode': DEFAULT_DIR_MODE | 0o040000,  # Directory
+    'st_nlink': 2,
+    'st_size': 0,
+    'st_ctime': 0,
+    'st_mtime': 0,
+    'st_atime': 0,
+}
+
+# Constant part of every regular file's attributes
+_FILE_ATTR_TEMPLATE = {
+    'st_mode': DEFAULT_FILE_MODE | 0o100000,  # Regular file
+    'st_nlink': 1,
+}
+
+@dataclass(slots=True)
+class FileInfo:
+    """
+    In-memory metadata for one file.
+    
+    Slotted so each entry is a small fixed record rather than a dict.
+    """
+    size: int = 0
+    ctime: int = 0
+    mtime: int = 0
+    atime: int = 0
+    blocks: Optional[Tuple] = None  # The file's blocks in chain order, once looked up
+    block_ends: Optional[List[int]] = None  # Cumulative end offset of each block
+    buffer: Optional[bytearray] = None  # Written data not yet stored on the chain
+
 class BlockchainFUSE(Operations):
     """FUSE filesystem with blockchain-backed storage."""
     
     def __init__(self):
         """Initialize the filesystem."""
-        self.files: Dict[str, Dict] = {}  # In-memory file metadata
+        self.files: Dict[str, FileInfo] = {}  # In-memory file metadata
+        self.blockchain = get_blockchain()
+        self.ipfs_client = get_ipfs_client()
+        self.chunk_cache = ChunkCache(CHUNK_CACHE_BYTES)
+        self._read_state: Dict[str, Dict[str, int]] = {}  # Sequential-read tracking per file
+        self._read_ahead = ThreadPoolExecutor(max_workers=1, thread_name_prefix='read-ahead')
+        self._clean: Set[str] = set()  # Files whose blocks passed the tampering check
+        self._readdir_cache: List[str] = []
+        self._readdir_key = None  # (blockchain version, known file count) the cache was built for
+        # FUSE calls arrive on several threads; this guards the file table,
+        # write buffers and read state (never held across network I/O or mining)
+        self._lock = threading.RLock()
+        self._unmounted = threading.Event()  # Ends the background tampering checks
         fs_logger.log_mount(MOUNT_POINT)
     
+    def init(self, path: str):
+        """Check stored files for tampering in the background once mounted."""
+        threading.Thread(target=self._tamper_check_loop, name='tamper-check', daemon=True).start()
+    
+    def _tamper_check_loop(self):
+        """Check every stored file now, then every TAMPER_RECHECK_SECONDS until unmount."""
+        self._verify_all_files()
+        while TAMPER_RECHECK_SECONDS > 0 and not self._unmounted.wait(TAMPER_RECHECK_SECONDS):
+            self._verify_all_files()
+    
+    def _verify_file(self, filename: str) -> bool:
+        """Run the tampering check for a file and record the result."""
+        clean = not self.blockchain.detect_tampering(filename)
+        with self._lock:
+            if clean:
+                self._clean.add(filename)
+            else:
+                self._clean.discard(filename)
+        return clean
+    
+    def _verify_all_files(self):
+        """Check every stored file, so later reads find them already clean."""
+        for filename in self.blockchain.get_filenames():
+            try:
+                self._verify_file(filename)
+            except Exception as e:
+                fs_logger.log_error("TAMPER_CHECK", str(e))
+    
     def getattr(self, path: str, fh=None):
         """Get file attributes."""
         if path == '/':
-            # Root directory attributes
-            return {
-                'st_mode': DEFAULT_DIR_MODE | 0o040000,  # Directory
-                'st_nlink': 2,
-                'st_size': 0,
-                'st_ctime': 0,
-                'st_mtime': 0,
-                'st_atime': 0,
-            }
+            return _ROOT_ATTR
         
         filename = path[1:]  # Remove leading slash
         
-        if filename in self.files:
-            file_info = self.files[filename]
-            return {
-                'st_mode': DEFAULT_FILE_MODE | 0o100000,  # Regular file
-                'st_nlink': 1,
-                'st_size': file_info['size'],
-                'st_ctime': file_info['ctime'],
-                'st_mtime': file_info['mtime'],
-                'st_atime': file_info['atime'],
-            }
+        with self._lock:
+            file_info = self.files.get(filename)
+            if file_info is not None:
+                return {
+                    **_FILE_ATTR_TEMPLATE,
+                    'st_size': file_info.size,
+                    'st_ctime': file_info.ctime,
+                    'st_mtime': file_info.mtime,
+                    'st_atime': file_info.atime,
+                }
         
-        # Check if file exists in blockchain
-        file_blocks = blockchain.get_file_blocks(filename)
+        # Check if file exists in blockchain (caches its layout in self.files)
+        file_blocks, block_ends = self._file_layout(filename)
         if file_blocks:
-            total_size = sum(block.file_size for block in file_blocks)
-            latest_block = max(file_blocks, key=lambda b: b.index)
-            
-            # Add to in-memory cache
-            self.files[filename] = {
-                'size': total_size,
-                'ctime': 0,
-                'mtime': 0,
-                'atime': 0,
-            }
+            total_size = block_ends[-1]
             
             return {
-                'st_mode': DEFAULT_FILE_MODE | 0o100000,
-                'st_nlink': 1,
+                **_FILE_ATTR_TEMPLATE,
                 'st_size': total_size,
                 'st_ctime': 0,
                 'st_mtime': 0,
@@ -72,131 +131,308 @@ class BlockchainFUSE(Operations):
         
         raise FuseOSError(errno.ENOENT)
     
+    def _file_layout(self, filename: str):
+        """
+        Get a file's blocks and the cumulative end offset of each block.
+        
+        Both are cached in the file's self.files entry the first time they
+        are needed; write() replaces the entry, which drops them.
+        
+        Returns:
+            (blocks, block_ends), both empty if the file has no blocks
+        """
+        with self._lock:
+            file_info = self.files.get(filename)
+            if file_info is not None and file_info.blocks is not None:
+                return file_info.blocks, file_info.block_ends
+            
+            file_blocks = self.blockchain.get_file_blocks(filename)
+            if not file_blocks:
+                return (), []
+            block_ends = list(accumulate(block.file_size for block in file_blocks))
+            
+            if file_info is None:
+                file_info = self.files[filename] = FileInfo(size=block_ends[-1])
+            file_info.blocks = file_blocks
+            file_info.block_ends = block_ends
+            return file_blocks, block_ends
+    
     def readdir(self, path: str, fh):
         """Read directory contents."""
         if path != '/':
             raise FuseOSError(errno.ENOENT)
         
-        # Get files from in-memory cache
-        files = list(self.files.keys())
-        
-        # Get files from blockchain
-        blockchain_files = set()
-        for block in blockchain.chain:
-            if block.filename != "GENESIS":
-                blockchain_files.add(block.filename)
-        
-        # Combine both sources
-        all_files = set(files) | blockchain_files
-        
-        return ['.', '..'] + list(all_files)
+        with self._lock:
+            # Entries only change when blocks are added or a file is created
+            key = (self.blockchain.version, len(self.files))
+            if key != self._readdir_key:
+                # Combine the in-memory files with the blockchain's filename index
+                all_files = set(self.files).union(self.blockchain.get_filenames())
+                self._readdir_cache = ['.', '..'] + list(all_files)
+                self._readdir_key = key
+            
+            return self._readdir_cache
     
     def read(self, path: str, size: int, offset: int, fh):
         """Read file data."""
         filename = path[1:]  # Remove leading slash
         
         try:
-            # Get file blocks from blockchain
-            file_blocks = blockchain.get_file_blocks(filename)
+            # Get file blocks (in chain order) and their end offsets
+            file_blocks, block_ends = self._file_layout(filename)
             if not file_blocks:
                 raise FuseOSError(errno.ENOENT)
             
-            # Sort blocks by index to maintain order
-            file_blocks.sort(key=lambda b: b.index)
-            
-            # Detect tampering
-            tampered_blocks = blockchain.detect_tampering(filename)
-            if tampered_blocks:
+            # Detect tampering, unless the file has already been checked
+            if filename not in self._clean and not self._verify_file(filename):
                 fs_logger.log_error("READ", f"Tampering detected in {filename}")
                 raise FuseOSError(errno.EIO)
             
-            # Reconstruct file from IPFS chunks
-            file_data = b''
-            chunk_count = 0
+            # Find the blocks that overlap [offset, offset + size)
+            if size <= 0 or offset >= block_ends[-1]:
+                return b''
+            first = bisect_right(block_ends, offset)
+            last = bisect_left(block_ends, offset + size, lo=first)
+            wanted_blocks = file_blocks[first:last + 1]
             
-            for block in file_blocks:
-                # Download chunk from IPFS
-                chunk_data = ipfs_client.download_chunk(block.ipfs_hash)
-                if chunk_data is None:
-                    fs_logger.log_error("READ", f"Failed to download chunk {block.ipfs_hash}")
-                    raise FuseOSError(errno.EIO)
-                
-                # Verify chunk integrity
-                if not ipfs_client.verify_chunk(chunk_data, block.chunk_hash):
-                    fs_logger.log_error("READ", f"Chunk integrity verification failed for {block.ipfs_hash}")
-                    raise FuseOSError(errno.EIO)
-                
-                file_data += chunk_data
-                chunk_count += 1
+            # Start prefetching what a sequential reader will ask for next
+            self._schedule_read_ahead(filename, file_blocks, block_ends, offset, offset + size, last)
+            
+            # Fetch only those chunks, concurrently, joined once at the end
+            parts = self._get_chunks(wanted_blocks)
+            chunk_count = len(parts)
             
+            file_data = b''.join(parts)
             fs_logger.log_read(filename, len(file_data), chunk_count)
             
-            # Return requested portion
-            return file_data[offset:offset + size]
+            # Return requested portion, relative to the first fetched block
+            start = offset - (block_ends[first] - file_blocks[first].file_size)
+            return file_data[start:start + size]
             
         except Exception as e:
             fs_logger.log_error("READ", str(e))
             raise FuseOSError(errno.EIO)
     
+    def _schedule_read_ahead(self, filename: str, file_blocks: Tuple, block_ends: List[int],
+                             offset: int, end: int, last: int):
+        """
+        Prefetch chunks past a sequential read into the chunk cache.
+        
+        A read that starts where the previous one ended is treated as
+        sequential, and up to READ_AHEAD_BYTES of the following blocks are
+        downloaded on a background thread. Any other offset bumps the
+        file's generation, which stops prefetches queued for the old
+        position.
+        
+        Args:
+            filename: File being read
+            file_blocks: The file's blocks in order
+            block_ends: Cumulative end offset of each block
+            offset: Start of the current read
+            end: End of the current read
+            last: Position in file_blocks of the last block the read covers
+        """
+        with self._lock:
+            state = self._read_state.setdefault(filename, {'next_offset': 0, 'generation': 0, 'prefetched': -1})
+            sequential = offset == state['next_offset']
+            state['next_offset'] = end
+            
+            if not sequential:
+                state['generation'] += 1
+                state['prefetched'] = -1
+                return
+            if READ_AHEAD_BYTES <= 0:
+                return
+            
+            # Top up only once the reader has used half of the prefetched window
+            if state['prefetched'] > last and block_ends[state['prefetched']] - end >= READ_AHEAD_BYTES // 2:
+                return
+            start = max(last + 1, state['prefetched'] + 1)
+            
+            blocks = []
+            budget = READ_AHEAD_BYTES
+            for block in file_blocks[start:]:
+                if budget <= 0:
+                    break
+                blocks.append(block)
+                budget -= block.file_size
+            
+            if blocks:
+                state['prefetched'] = start + len(blocks) - 1
+                self._read_ahead.submit(self._prefetch, filename, state['generation'], blocks)
+    
+    def _prefetch(self, filename: str, generation: int, blocks: List):
+        """Download blocks into the chunk cache until the reader moves elsewhere."""
+        for block in blocks:
+            if self._read_state.get(filename, {}).get('generation') != generation:
+                return
+            try:
+                self._get_chunk(block)
+            except Exception:
+                return  # The foreground read will retry and report the failure
+    
+    def _get_chunk(self, block) -> bytes:
+        """Get the verified chunk data for a single block."""
+        return self._get_chunks([block])[0]
+    
+    def _get_chunks(self, blocks: List) -> List[bytes]:
+        """
+        Get the verified chunk data for several blocks.
+        
+        Chunks are served from the chunk cache when possible. The rest are
+        downloaded from IPFS concurrently, verified as a batch and cached.
+        
+        Args:
+            blocks: Blocks whose chunks are needed
+            
+        Returns:
+            Chunk data in the same order as the blocks
+        """
+        chunks = [self.chunk_cache.get(block.ipfs_hash, block.chunk_hash) for block in blocks]
+        missing = [i for i, chunk_data in enumerate(chunks) if chunk_data is None]
+        if not missing:
+            return chunks
+        
+        # Download missing chunks from IPFS
+        downloaded = self.ipfs_client.download_chunks([blocks[i].ipfs_hash for i in missing])
+        for i, chunk_data in zip(missing, downloaded):
+            if chunk_data is None:
+                fs_logger.log_error("READ", f"Failed to download chunk {blocks[i].ipfs_hash}")
+                raise FuseOSError(errno.EIO)
+        
+        # Verify chunk integrity
+        results = self.ipfs_client.verify_chunks(downloaded, [blocks[i].chunk_hash for i in missing])
+        for i, chunk_data, is_valid in zip(missing, downloaded, results):
+            block = blocks[i]
+            if not is_valid:
+                fs_logger.log_error("READ", f"Chunk integrity verification failed for {block.ipfs_hash}")
+                raise FuseOSError(errno.EIO)
+            
+            self.chunk_cache.put(block.ipfs_hash, block.chunk_hash, chunk_data)
+            chunks[i] = chunk_data
+        
+        return chunks
+    
     def write(self, path: str, data: bytes, offset: int, fh):
-        """Write file data."""
+        """
+        Write file data.
+        
+        Writes are buffered in memory and stored on the chain when the file
+        is flushed, so a run of sequential writes becomes one new version
+        of the file. Writes anywhere other than the end of the buffer are
+        not supported.
+        """
         filename = path[1:]  # Remove leading slash
         
         try:
-            # For simplicity, we don't support partial writes or appends
-            # Each write operation creates a new version of the file
-            if offset != 0:
-                fs_logger.log_error("WRITE", "Partial writes not supported")
-                raise FuseOSError(errno.ENOSYS)
+            with self._lock:
+                file_info = self.files.get(filename)
+                if file_info is None or file_info.buffer is None:
+                    # Each new version of the file starts at offset 0
+                    if offset != 0:
+                        fs_logger.log_error("WRITE", "Partial writes not supported")
+                        raise FuseOSError(errno.ENOSYS)
+                    file_info = self.files[filename] = FileInfo(buffer=bytearray())
+                elif offset != len(file_info.buffer):
+                    fs_logger.log_error("WRITE", "Partial writes not supported")
+                    raise FuseOSError(errno.ENOSYS)
+                
+                file_info.buffer += data
+                file_info.size = len(file_info.buffer)
+                return len(data)
             
-            # Split data into chunks
-            chunks = []
-            for i in range(0, len(data), CHUNK_SIZE):
-                chunk = data[i:i + CHUNK_SIZE]
-                chunks.append(chunk)
+        except Exception as e:
+            fs_logger.log_error("WRITE", str(e))
+            raise FuseOSError(errno.EIO)
+    
+    def _commit(self, filename: str):
+        """Store a file's buffered writes on the chain as a new version."""
+        with self._lock:
+            file_info = self.files.get(filename)
+            if file_info is None or file_info.buffer is None:
+                return 0
             
-            # Process each chunk
-            chunk_count = 0
-            for chunk in chunks:
-                # Calculate chunk hash
-                chunk_hash = hashlib.sha256(chunk).hexdigest()
-                
-                # Upload chunk to IPFS
-                ipfs_hash = ipfs_client.upload_chunk(chunk)
-                if ipfs_hash is None:
-                    fs_logger.log_error("WRITE", f"Failed to upload chunk to IPFS")
-                    raise FuseOSError(errno.EIO)
-                
-                # Add block to blockchain
-                blockchain.add_block(filename, len(chunk), chunk_hash, ipfs_hash)
-                chunk_count += 1
+            # Detach the buffer so it is committed exactly once
+            data, file_info.buffer = file_info.buffer, None
+        
+        try:
+            # Split data into chunks (zero-copy views into data)
+            view = memoryview(data)
+            chunks = [view[i:i + CHUNK_SIZE] for i in range(0, len(view), CHUNK_SIZE)]
             
-            # Update in-memory file info
-            self.files[filename] = {
-                'size': len(data),
-                'ctime': 0,
-                'mtime': 0,
-                'atime': 0,
-            }
+            # Hash all chunks in one batch
+            chunk_hashes = chunk_digests(chunks)
+            
+            # Upload new chunks to IPFS concurrently, reusing stored copies
+            ipfs_hashes = self._chunk_ipfs_hashes(chunks, chunk_hashes)
+            
+            # Add all blocks to blockchain in one batch once every chunk is
+            # uploaded; the chain is only locked for mining and the append
+            entries = self._block_entries(filename, chunks, chunk_hashes, ipfs_hashes)
+            chunk_count = len(self.blockchain.add_blocks(entries))
+            
+            # Update in-memory file info, unless a new version was started meanwhile
+            with self._lock:
+                if self.files.get(filename) is file_info:
+                    self.files[filename] = FileInfo(size=len(data))
             
             fs_logger.log_write(filename, len(data), chunk_count)
-            return len(data)
+            return 0
             
         except Exception as e:
             fs_logger.log_error("WRITE", str(e))
             raise FuseOSError(errno.EIO)
     
+    def flush(self, path: str, fh):
+        """Commit buffered writes when a file descriptor is closed."""
+        return self._commit(path[1:])
+    
+    def fsync(self, path: str, datasync: int, fh):
+        """Commit buffered writes on fsync."""
+        return self._commit(path[1:])
+    
+    def release(self, path: str, fh):
+        """Commit any writes still buffered when the file is released."""
+        return self._commit(path[1:])
+    
+    def _chunk_ipfs_hashes(self, chunks: List, chunk_hashes: List[str]) -> List[Optional[str]]:
+        """
+        Get each chunk's IPFS hash in chunk order.
+        
+        Only chunks whose contents are neither on the chain already nor
+        earlier in the same write are uploaded; duplicates reuse the IPFS
+        hash of the stored copy.
+        """
+        ipfs_by_chunk = {}
+        new_hashes = []
+        new_chunks = []
+        for chunk, chunk_hash in zip(chunks, chunk_hashes):
+            if chunk_hash not in ipfs_by_chunk:
+                ipfs_by_chunk[chunk_hash] = self.blockchain.get_chunk_ipfs_hash(chunk_hash)
+                if ipfs_by_chunk[chunk_hash] is None:
+                    new_hashes.append(chunk_hash)
+                    new_chunks.append(chunk)
+        
+        ipfs_by_chunk.update(zip(new_hashes, self.ipfs_client.upload_chunks(new_chunks)))
+        return [ipfs_by_chunk[chunk_hash] for chunk_hash in chunk_hashes]
+    
+    def _block_entries(self, filename: str, chunks: List, chunk_hashes: List[str],
+                       ipfs_hashes: List[Optional[str]]) -> List[Tuple[str, int, str, str]]:
+        """Build add_blocks entries in chunk order, failing if any upload was unsuccessful."""
+        if None in ipfs_hashes:
+            fs_logger.log_error("WRITE", f"Failed to upload chunk to IPFS")
+            raise FuseOSError(errno.EIO)
+        
+        return [(filename, len(chunk), chunk_hash, ipfs_hash)
+                for chunk, chunk_hash, ipfs_hash in zip(chunks, chunk_hashes, ipfs_hashes)]
+    
     def create(self, path: str, mode: int, fi=None):
         """Create a new file."""
         filename = path[1:]  # Remove leading slash
         
         # Initialize empty file
-        self.files[filename] = {
-            'size': 0,
-            'ctime': 0,
-            'mtime': 0,
-            'atime': 0,
-        }
+        with self._lock:
+            self.files[filename] = FileInfo()
         
         return 0
     
@@ -223,6 +459,12 @@ class BlockchainFUSE(Operations):
     def utimens(self, path: str, times=None):
         """Update file timestamps (not implemented)."""
         return 0
+    
+    def destroy(self, path: str):
+        """Stop background checks, prefetching and the mining pool on unmount."""
+        self._unmounted.set()
+        self._read_ahead.shutdown(wait=False, cancel_futures=True)
+        self.blockchain.close()
 
 def main():
     """Main function to mount the filesystem."""
@@ -233,7 +475,7 @@ def main():
     mountpoint = sys.argv[1]
     
     # Check if IPFS is running
-    if not ipfs_client.is_connected():
+    if not get_ipfs_client().is_connected():
         print("Error: IPFS daemon is not running. Please start IPFS first.")
         print("Run: ipfs daemon")
         sys.exit(1)
@@ -251,7 +493,11 @@ def main():
             mountpoint,
             foreground=True,
             allow_other=True,
-            nothreads=True
+            # Let the kernel send large requests instead of 4KB pieces
+            big_writes=True,
+            max_read=FUSE_MAX_IO,
+            max_write=FUSE_MAX_IO,
+            max_readahead=FUSE_MAX_IO
         )
     except KeyboardInterrupt:
         fs_logger.log_unmount(mountpoint)
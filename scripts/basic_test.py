@@ -8,6 +8,25 @@ import sys
 import json
 import subprocess
 
+# Result of `ipfs version`, cached so repeated test runs don't fork it again
+_ipfs_version_result = None
+
+def get_ipfs_version():
+    """Run `ipfs version` once and reuse the result."""
+    global _ipfs_version_result
+    if _ipfs_version_result is None:
+        _ipfs_version_result = subprocess.run(['ipfs', 'version'],
+                                              capture_output=True, text=True, timeout=5)
+    return _ipfs_version_result
+
+def list_directory(directory):
+    """Map entry names to os.DirEntry objects for a directory (empty if it is missing)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: entry for entry in entries}
+    except OSError:
+        return {}
+
 def test_environment():
     """Test the basic environment setup."""
     print("🔍 Testing Environment Setup")
@@ -23,9 +42,14 @@ def test_environment():
         'myfuse/log.py'
     ]
     
+    # One directory listing per directory instead of a stat per file
+    listings = {}
     missing_files = []
     for file_path in required_files:
-        if os.path.exists(file_path):
+        directory, name = os.path.split(file_path)
+        if directory not in listings:
+            listings[directory] = list_directory(directory or '.')
+        if name in listings[directory]:
             print(f"   ✅ {file_path}")
         else:
             print(f"   ❌ {file_path}")
@@ -87,8 +111,7 @@ def test_ipfs_availability():
     print("-" * 30)
     
     try:
-        result = subprocess.run(['ipfs', 'version'], 
-                              capture_output=True, text=True, timeout=5)
+        result = get_ipfs_version()
         if result.returncode == 0:
             version_info = result.stdout.strip()
             print(f"   ✅ IPFS found: {version_info}")
@@ -125,7 +148,7 @@ def test_blockchain_creation():
         from blockchain import Blockchain
         
         # Create a test blockchain
-        test_blockchain = Blockchain('test_blockchain.json')
+        test_blockchain = Blockchain('test_blockchain.bin')
         
         print("   ✅ Blockchain class imported")
         print(f"   ✅ Blockchain created with {len(test_blockchain.chain)} blocks")
@@ -138,8 +161,9 @@ def test_blockchain_creation():
             print("   ❌ Blockchain validation failed")
         
         # Clean up test file
-        if os.path.exists('test_blockchain.json'):
-            os.remove('test_blockchain.json')
+        test_blockchain.close()
+        if os.path.exists('test_blockchain.bin'):
+            os.remove('test_blockchain.bin')
         
         return is_valid
         
@@ -153,9 +177,10 @@ def test_directory_structure():
     print("-" * 30)
     
     directories = ['mountpoint', 'myfuse']
+    present = list_directory('.')
     
     for directory in directories:
-        if os.path.exists(directory):
+        if directory in present:
             print(f"   ✅ {directory}/ exists")
         else:
             try:
@@ -261,10 +286,3 @@ if __name__ == '__main__':
         print("\n❌ Tests interrupted by user")
     except Exception as e:
         print(f"\n💥 Tests crashed: {e}")
-
-# Also run when imported (for execution environment)
-try:
-    success = run_all_tests()
-    print(f"\n{'✅ Basic tests completed successfully' if success else '❌ Basic tests completed with issues'}")
-except Exception as e:
-    print(f"\n💥 Basic tests crashed: {e}")
@@ -1,203 +1,212 @@
 """
 Interactive demo of the blockchain FUSE filesystem.
+
+Run with --slow to pause between steps and wait for Enter.
 """
 
+import io
 import os
 import sys
 import time
-import subprocess
+import hashlib
+from contextlib import redirect_stdout
+from itertools import islice, pairwise
+
+# Pauses and Enter prompts only happen with --slow, so a plain run
+# finishes as fast as the demo steps themselves
+SLOW = '--slow' in sys.argv
+
+HEADER_BAR = '🎬' * 20
+
+def simulated_entry(filename, size, description):
+    """Build an add_blocks entry for a simulated file."""
+    content = description.encode() * 10
+    chunk_hash = hashlib.sha256(content).hexdigest()
+    ipfs_hash = f"Qm{chunk_hash[:40]}"  # Simulate IPFS hash
+    return (filename, size, chunk_hash, ipfs_hash)
+
+# Files added by the demo; their content, and so their hashes, never change
+DEMO_FILES = [
+    simulated_entry("document.txt", 1024, "Document content hash"),
+    simulated_entry("image.jpg", 2048, "Image content hash"),
+    simulated_entry("data.csv", 512, "CSV data hash")
+]
+
+def pause(seconds):
+    """Sleep for dramatic effect, only in --slow mode."""
+    if SLOW:
+        time.sleep(seconds)
+
+def wait_for_enter(prompt):
+    """Wait for the user to press Enter, only in --slow mode."""
+    if SLOW:
+        input(prompt)
+
+def run_step(step):
+    """
+    Run a demo step.
+    
+    Outside --slow mode the step's output is collected and written in
+    one go rather than line by line.
+    """
+    if SLOW:
+        step()
+        return
+    
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            step()
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+def load_blockchain():
+    """Import the project's blockchain module and return the shared chain."""
+    if 'myfuse' not in sys.path:
+        sys.path.append('myfuse')
+    from blockchain import get_blockchain
+    return get_blockchain()
 
 def print_demo_header(title):
     """Print demo header."""
-    print(f"\n{'🎬'*20}")
+    print(f"\n{HEADER_BAR}")
     print(f"  {title}")
-    print(f"{'🎬'*20}")
+    print(HEADER_BAR)
 
 def demo_blockchain_basics():
     """Demo basic blockchain operations."""
     print_demo_header("BLOCKCHAIN BASICS DEMO")
     
     print("Let's explore the blockchain implementation...")
-    time.sleep(2)
+    pause(2)
     
     print("\n📊 Current blockchain status:")
-    subprocess.run([
-        sys.executable, '-c', '''
-import sys
-sys.path.append("myfuse")
-from blockchain import blockchain
-
-print(f"   Blocks: {len(blockchain.chain)}")
-print(f"   Valid: {blockchain.validate_chain()}")
-
-if len(blockchain.chain) > 0:
-    latest = blockchain.get_latest_block()
-    print(f"   Latest block: {latest.index}")
-    print(f"   Latest hash: {latest.hash[:16]}...")
-'''
-    ])
+    blockchain = load_blockchain()
+    
+    print(f"   Blocks: {len(blockchain.chain)}")
+    print(f"   Valid: {blockchain.validate_chain()}")
     
-    input("\nPress Enter to continue...")
+    if len(blockchain.chain) > 0:
+        latest = blockchain.get_latest_block()
+        print(f"   Latest block: {latest.index}")
+        print(f"   Latest hash: {latest.hash[:16]}...")
 
 def demo_add_files():
     """Demo adding files to blockchain."""
     print_demo_header("ADDING FILES TO BLOCKCHAIN")
     
     print("Let's add some files to the blockchain...")
-    time.sleep(1)
+    pause(1)
     
-    files_to_add = [
-        ("document.txt", 1024, "Document content hash"),
-        ("image.jpg", 2048, "Image content hash"),
-        ("data.csv", 512, "CSV data hash")
-    ]
+    blockchain = load_blockchain()
     
-    for filename, size, description in files_to_add:
-        print(f"\n📄 Adding {filename} ({size} bytes)...")
-        subprocess.run([
-            sys.executable, '-c', f'''
-import sys
-sys.path.append("myfuse")
-import hashlib
-from blockchain import blockchain
-
-# Simulate file content
-content = b"{description}" * 10
-chunk_hash = hashlib.sha256(content).hexdigest()
-ipfs_hash = f"Qm{chunk_hash[:40]}"  # Simulate IPFS hash
-
-# Add to blockchain
-block = blockchain.add_block("{filename}", {size}, chunk_hash, ipfs_hash)
-print(f"   ✅ Added as block {block.index}")
-print(f"   📋 Hash: {block.hash[:16]}...")
-'''
-        ])
-        time.sleep(1)
+    entries = []
+    for entry in DEMO_FILES:
+        # Re-running the demo shouldn't store the same files again
+        if blockchain.has_file(entry[0]):
+            print(f"\n📄 {entry[0]} is already in the blockchain, skipping")
+            continue
+        entries.append(entry)
     
-    print(f"\n📊 Blockchain now has files!")
-    subprocess.run([
-        sys.executable, '-c', '''
-import sys
-sys.path.append("myfuse")
-from blockchain import blockchain
-
-files = set(b.filename for b in blockchain.chain if b.filename != "GENESIS")
-print(f"   Files: {list(files)}")
-print(f"   Total blocks: {len(blockchain.chain)}")
-'''
-    ])
+    # Mine all blocks and append them to the log in one batch
+    if entries:
+        print(f"\n⛏️  Mining {len(entries)} blocks...")
+    blocks = blockchain.add_blocks(entries)
+    
+    for block in blocks:
+        print(f"\n📄 Added {block.filename} ({block.file_size} bytes)")
+        print(f"   ✅ Added as block {block.index}")
+        print(f"   📋 Hash: {block.hash[:16]}...")
+        pause(1)
     
-    input("\nPress Enter to continue...")
+    print(f"\n📊 Blockchain now has files!")
+    print(f"   Files: {blockchain.get_filenames()}")
+    print(f"   Total blocks: {len(blockchain.chain)}")
 
 def demo_integrity_check():
     """Demo integrity checking."""
     print_demo_header("INTEGRITY VERIFICATION DEMO")
     
     print("Let's verify the blockchain integrity...")
-    time.sleep(1)
+    pause(1)
     
-    subprocess.run([
-        sys.executable, '-c', '''
-import sys
-sys.path.append("myfuse")
-from blockchain import blockchain
-
-print("🔍 Verifying blockchain...")
-is_valid = blockchain.validate_chain()
-print(f"   Result: {'✅ VALID' if is_valid else '❌ INVALID'}")
-
-print("\\n🔍 Checking individual files...")
-files = set(b.filename for b in blockchain.chain if b.filename != "GENESIS")
-for filename in files:
-    tampered = blockchain.detect_tampering(filename)
-    if tampered:
-        print(f"   ⚠️  {filename}: Tampering detected!")
-    else:
-        print(f"   ✅ {filename}: Integrity verified")
-'''
-    ])
+    blockchain = load_blockchain()
     
-    input("\nPress Enter to continue...")
+    print("🔍 Verifying blockchain...")
+    is_valid = blockchain.validate_chain()
+    print(f"   Result: {'✅ VALID' if is_valid else '❌ INVALID'}")
+    
+    print("\n🔍 Checking individual files...")
+    for filename in blockchain.get_filenames():
+        tampered = blockchain.detect_tampering(filename)
+        if tampered:
+            print(f"   ⚠️  {filename}: Tampering detected!")
+        else:
+            print(f"   ✅ {filename}: Integrity verified")
 
 def demo_tampering_detection():
     """Demo tampering detection."""
     print_demo_header("TAMPERING DETECTION DEMO")
     
     print("Let's simulate tampering and see how it's detected...")
-    time.sleep(1)
+    pause(1)
     
     print("\n🔧 Simulating blockchain tampering...")
-    subprocess.run([
-        sys.executable, '-c', '''
-import sys
-sys.path.append("myfuse")
-from blockchain import blockchain
-
-if len(blockchain.chain) > 1:
-    print("   📝 Original blockchain is valid")
-    print(f"   ✅ Validation: {blockchain.validate_chain()}")
-    
-    # Corrupt a block
-    original_hash = blockchain.chain[1].hash
-    blockchain.chain[1].hash = "corrupted_hash_12345"
+    blockchain = load_blockchain()
     
-    print("\\n   🔨 Corrupting block 1...")
-    print(f"   📝 Changed hash from {original_hash[:16]}... to corrupted_hash_12345")
-    
-    # Check validation
-    print("\\n   🔍 Re-validating blockchain...")
-    is_valid = blockchain.validate_chain()
-    print(f"   ❌ Validation: {is_valid} (tampering detected!)")
-    
-    # Restore original hash
-    blockchain.chain[1].hash = original_hash
-    print("\\n   🔧 Restoring original hash...")
-    print(f"   ✅ Validation: {blockchain.validate_chain()} (integrity restored)")
-else:
-    print("   ⚠️  Need more blocks for tampering demo")
-'''
-    ])
-    
-    input("\nPress Enter to continue...")
+    if len(blockchain.chain) > 1:
+        print("   📝 Original blockchain is valid")
+        print(f"   ✅ Validation: {blockchain.validate_chain()}")
+        
+        # Corrupt a block (in memory only; nothing is saved)
+        original_hash = blockchain.chain[1].hash
+        blockchain.chain[1].hash = "corrupted_hash_12345"
+        
+        print("\n   🔨 Corrupting block 1...")
+        print(f"   📝 Changed hash from {original_hash[:16]}... to corrupted_hash_12345")
+        
+        # Check validation
+        print("\n   🔍 Re-validating blockchain...")
+        is_valid = blockchain.validate_chain()
+        print(f"   ❌ Validation: {is_valid} (tampering detected!)")
+        
+        # Restore original hash
+        blockchain.chain[1].hash = original_hash
+        print("\n   🔧 Restoring original hash...")
+        print(f"   ✅ Validation: {blockchain.validate_chain()} (integrity restored)")
+    else:
+        print("   ⚠️  Need more blocks for tampering demo")
 
 def demo_blockchain_structure():
     """Demo blockchain structure."""
     print_demo_header("BLOCKCHAIN STRUCTURE DEMO")
     
     print("Let's examine the blockchain structure...")
-    time.sleep(1)
+    pause(1)
     
-    subprocess.run([
-        sys.executable, '-c', '''
-import sys
-sys.path.append("myfuse")
-from blockchain import blockchain
-
-print("📋 Blockchain Structure:")
-print("=" * 40)
-
-for i, block in enumerate(blockchain.chain[:5]):  # Show first 5 blocks
-    print(f"\\nBlock {block.index}:")
-    print(f"   Timestamp: {block.timestamp}")
-    print(f"   Filename: {block.filename}")
-    print(f"   File Size: {block.file_size}")
-    print(f"   Previous Hash: {block.previous_hash[:16]}...")
-    print(f"   Current Hash: {block.hash[:16]}...")
-    print(f"   Nonce: {block.nonce}")
-
-if len(blockchain.chain) > 5:
-    print(f"\\n... and {len(blockchain.chain) - 5} more blocks")
-
-print("\\n🔗 Hash Chain Verification:")
-for i in range(1, min(4, len(blockchain.chain))):
-    current = blockchain.chain[i]
-    previous = blockchain.chain[i-1]
-    linked = current.previous_hash == previous.hash
-    print(f"   Block {i-1} -> Block {i}: {'✅' if linked else '❌'}")
-'''
-    ])
+    chain = load_blockchain().chain
+    chain_length = len(chain)
+    
+    print("📋 Blockchain Structure:")
+    print("=" * 40)
     
-    input("\nPress Enter to continue...")
+    for block in islice(chain, 5):  # Show first 5 blocks
+        print(f"\nBlock {block.index}:")
+        print(f"   Timestamp: {block.timestamp}")
+        print(f"   Filename: {block.filename}")
+        print(f"   File Size: {block.file_size}")
+        print(f"   Previous Hash: {block.previous_hash[:16]}...")
+        print(f"   Current Hash: {block.hash[:16]}...")
+        print(f"   Nonce: {block.nonce}")
+    
+    if chain_length > 5:
+        print(f"\n... and {chain_length - 5} more blocks")
+    
+    print("\n🔗 Hash Chain Verification:")
+    for previous, current in pairwise(islice(chain, 4)):
+        linked = current.previous_hash == previous.hash
+        print(f"   Block {previous.index} -> Block {current.index}: {'✅' if linked else '❌'}")
 
 def show_next_steps():
     """Show next steps after demo."""
@@ -251,7 +260,7 @@ This demo will show you:
 Let's get started!
 """)
     
-    input("Press Enter to begin the demo...")
+    wait_for_enter("Press Enter to begin the demo...")
     
     # Check if setup is complete
     if not os.path.exists('myfuse/blockchain.py'):
@@ -259,12 +268,12 @@ Let's get started!
         return
     
     try:
-        demo_blockchain_basics()
-        demo_add_files()
-        demo_integrity_check()
-        demo_tampering_detection()
-        demo_blockchain_structure()
-        show_next_steps()
+        for step in (demo_blockchain_basics, demo_add_files, demo_integrity_check,
+                     demo_tampering_detection, demo_blockchain_structure):
+            run_step(step)
+            wait_for_enter("\nPress Enter to continue...")
+        
+        run_step(show_next_steps)
         
         print("\n🎉 Demo completed! Thank you for exploring the blockchain filesystem!")
         
@@ -0,0 +1,125 @@
+"""
+Automated checks run by scripts/run_guide.py.
+Each check runs in the calling process and prints its own progress.
+"""
+
+import os
+import sys
+import hashlib
+
+def load_project():
+    """Make the myfuse modules importable."""
+    if 'myfuse' not in sys.path:
+        sys.path.append('myfuse')
+
+def run_basic_components():
+    """Create a scratch blockchain, add a block and validate it."""
+    load_project()
+    from blockchain import Blockchain
+    
+    # Create test blockchain
+    bc = Blockchain("test_chain.bin")
+    print(f"✅ Blockchain created with {len(bc.chain)} blocks")
+    
+    # Add test block
+    bc.add_block("test.txt", 1024, "abc123", "ipfs_hash_123")
+    print(f"✅ Added block, now have {len(bc.chain)} blocks")
+    
+    # Validate chain
+    is_valid = bc.validate_chain()
+    print(f"✅ Blockchain validation: {'PASSED' if is_valid else 'FAILED'}")
+    
+    # Clean up
+    bc.close()
+    if os.path.exists("test_chain.bin"):
+        os.remove("test_chain.bin")
+    print("✅ Test completed successfully")
+
+def run_file_operations():
+    """Chunk a small file, store it on the chain and IPFS, then rebuild it."""
+    load_project()
+    from blockchain import get_blockchain
+    from ipfs_client import get_ipfs_client
+    blockchain = get_blockchain()
+    ipfs_client = get_ipfs_client()
+    
+    # Test data
+    test_data = b"Hello, blockchain world! This is a test file for chunking."
+    chunk_size = 32  # Small chunks for testing
+    
+    print(f"📄 Test data: {len(test_data)} bytes")
+    
+    # Split into chunks
+    chunks = [test_data[i:i + chunk_size] for i in range(0, len(test_data), chunk_size)]
+    print(f"📦 Split into {len(chunks)} chunks")
+    
+    # Process each chunk
+    filename = "test_file.txt"
+    for i, chunk in enumerate(chunks):
+        chunk_hash = hashlib.sha256(chunk).hexdigest()
+        ipfs_hash = ipfs_client.upload_chunk(chunk)
+        
+        # Add to blockchain
+        block = blockchain.add_block(filename, len(chunk), chunk_hash, ipfs_hash)
+        print(f"   ✅ Chunk {i+1}: {len(chunk)} bytes -> Block {block.index}")
+    
+    # Verify file blocks
+    file_blocks = blockchain.get_file_blocks(filename)
+    print(f"📋 File has {len(file_blocks)} blocks in blockchain")
+    
+    # Test reconstruction
+    parts = []
+    for block in file_blocks:
+        chunk_data = ipfs_client.download_chunk(block.ipfs_hash)
+        if chunk_data and ipfs_client.verify_chunk(chunk_data, block.chunk_hash):
+            parts.append(chunk_data)
+            print(f"   ✅ Chunk {block.index} verified and reconstructed")
+        else:
+            print(f"   ❌ Chunk {block.index} verification failed")
+    reconstructed = b''.join(parts)
+    
+    # Verify reconstruction
+    if reconstructed == test_data:
+        print("🎉 File reconstruction successful!")
+    else:
+        print("❌ File reconstruction failed!")
+        print(f"   Original: {test_data}")
+        print(f"   Reconstructed: {reconstructed}")
+
+def run_integrity_verification():
+    """Validate the chain and check every stored file for tampering."""
+    load_project()
+    from blockchain import get_blockchain
+    blockchain = get_blockchain()
+    
+    # Check current blockchain
+    print(f"📊 Current blockchain: {len(blockchain.chain)} blocks")
+    
+    # Validate blockchain
+    is_valid = blockchain.validate_chain()
+    print(f"🔍 Blockchain validation: {'✅ VALID' if is_valid else '❌ INVALID'}")
+    
+    # Get blockchain info
+    info = blockchain.get_blockchain_info()
+    print(f"📈 Blockchain info:")
+    print(f"   Total blocks: {info['total_blocks']}")
+    print(f"   Files: {len(info['files'])}")
+    print(f"   Valid: {is_valid}")
+    
+    # List files
+    files = blockchain.get_filenames()
+    
+    if files:
+        print(f"📁 Files in blockchain: {list(files)}")
+        
+        # Test tampering detection for each file
+        for filename in files:
+            tampered = blockchain.detect_tampering(filename)
+            if tampered:
+                print(f"   ⚠️  {filename}: Tampering detected in blocks {tampered}")
+            else:
+                print(f"   ✅ {filename}: No tampering detected")
+    else:
+        print("📁 No files in blockchain yet")
+    
+    print("🎉 Integrity verification completed!")
@@ -3,135 +3,140 @@ Manual test guide for the blockchain FUSE filesystem.
 Provides step-by-step instructions for manual testing.
 """
 
-def print_header(title):
-    """Print a formatted header."""
-    print(f"\n{'='*60}")
-    print(f"  {title}")
-    print(f"{'='*60}")
+import sys
 
-def print_step(step_num, title, commands, notes=None):
-    """Print a formatted test step."""
-    print(f"\n📋 Step {step_num}: {title}")
-    print("-" * 40)
+HEADER_BAR = '=' * 60
+
+def format_header(title):
+    """Format a header."""
+    return f"\n{HEADER_BAR}\n  {title}\n{HEADER_BAR}\n"
+
+def format_step(step_num, title, commands, notes=None):
+    """Format a test step."""
+    lines = [f"\n📋 Step {step_num}: {title}", "-" * 40]
     
     if isinstance(commands, str):
         commands = [commands]
     
     for i, command in enumerate(commands, 1):
-        print(f"   {i}. {command}")
+        lines.append(f"   {i}. {command}")
     
     if notes:
-        print(f"\n   💡 Note: {notes}")
+        lines.append(f"\n   💡 Note: {notes}")
+    
+    return "\n".join(lines) + "\n"
 
-def show_manual_test_guide():
-    """Show complete manual testing guide."""
+def build_manual_test_guide():
+    """Build the complete manual testing guide text."""
+    parts = []
     
-    print_header("BLOCKCHAIN FUSE FILESYSTEM - MANUAL TEST GUIDE")
+    parts.append(format_header("BLOCKCHAIN FUSE FILESYSTEM - MANUAL TEST GUIDE"))
     
-    print("""
+    parts.append("""
 This guide will walk you through manually testing the blockchain-backed
 FUSE filesystem. Follow each step in order and verify the results.
+
 """)
     
-    print_step(1, "Environment Setup", [
+    parts.append(format_step(1, "Environment Setup", [
         "Ensure Python 3.10+ is installed",
         "Install dependencies: pip install fusepy ipfshttpclient",
         "Install IPFS from https://ipfs.io/",
         "Initialize IPFS: ipfs init (if first time)"
-    ], "You only need to do this once")
+    ], "You only need to do this once"))
     
-    print_step(2, "Start IPFS Daemon", [
+    parts.append(format_step(2, "Start IPFS Daemon", [
         "Open Terminal 1",
         "Run: ipfs daemon",
         "Wait for 'Daemon is ready' message"
-    ], "Keep this terminal open during testing")
+    ], "Keep this terminal open during testing"))
     
-    print_step(3, "Start Blockchain Filesystem", [
+    parts.append(format_step(3, "Start Blockchain Filesystem", [
         "Open Terminal 2",
         "Navigate to project directory",
         "Run: python myfuse/main.py ./mountpoint",
         "Wait for 'Mounting blockchain-backed filesystem' message"
-    ], "Keep this terminal open during testing")
+    ], "Keep this terminal open during testing"))
     
-    print_step(4, "Basic File Operations", [
+    parts.append(format_step(4, "Basic File Operations", [
         "Open Terminal 3",
         "Create a test file: echo 'Hello blockchain!' > ./mountpoint/test1.txt",
         "Read the file: cat ./mountpoint/test1.txt",
         "Verify output matches input"
-    ], "This tests basic read/write operations")
+    ], "This tests basic read/write operations"))
     
-    print_step(5, "Multiple File Test", [
+    parts.append(format_step(5, "Multiple File Test", [
         "Create another file: echo 'Second file' > ./mountpoint/test2.txt",
         "Create a larger file: echo 'Large file content' | head -c 2048 > ./mountpoint/large.txt",
         "List files: ls -la ./mountpoint/",
         "Verify all files are listed"
-    ], "This tests multiple file handling")
+    ], "This tests multiple file handling"))
     
-    print_step(6, "Binary File Test", [
+    parts.append(format_step(6, "Binary File Test", [
         "Create binary file: dd if=/dev/urandom of=./mountpoint/binary.bin bs=1024 count=2",
         "Check file size: ls -lh ./mountpoint/binary.bin",
         "Verify file exists and has correct size"
-    ], "This tests binary file support")
+    ], "This tests binary file support"))
     
-    print_step(7, "Blockchain Verification", [
+    parts.append(format_step(7, "Blockchain Verification", [
         "Verify blockchain: python myfuse/integrity_checker.py verify-blockchain",
         "Check for '✅ Blockchain integrity verified successfully' message",
         "Show blockchain info: python myfuse/integrity_checker.py info"
-    ], "This verifies blockchain integrity")
+    ], "This verifies blockchain integrity"))
     
-    print_step(8, "File Integrity Verification", [
+    parts.append(format_step(8, "File Integrity Verification", [
         "Verify specific file: python myfuse/integrity_checker.py verify-file --file test1.txt",
         "Verify large file: python myfuse/integrity_checker.py verify-file --file large.txt",
         "Check for '✅ File verified successfully' messages"
-    ], "This verifies individual file integrity")
+    ], "This verifies individual file integrity"))
     
-    print_step(9, "List All Files", [
+    parts.append(format_step(9, "List All Files", [
         "List blockchain files: python myfuse/integrity_checker.py list-files",
         "Compare with directory listing: ls ./mountpoint/",
         "Verify both lists match"
-    ], "This checks file listing consistency")
+    ], "This checks file listing consistency"))
     
-    print_step(10, "View Blockchain Contents", [
+    parts.append(format_step(10, "View Blockchain Contents", [
         "Print blockchain: python myfuse/integrity_checker.py print-blockchain",
         "Examine block structure and hashes",
         "Verify each file has corresponding blocks"
-    ], "This shows the complete blockchain structure")
+    ], "This shows the complete blockchain structure"))
     
-    print_step(11, "Test Immutability", [
+    parts.append(format_step(11, "Test Immutability", [
         "Try to modify existing file: echo 'modified' > ./mountpoint/test1.txt",
         "Check if operation fails or creates new version",
         "Verify original content integrity"
-    ], "This tests the immutability feature")
+    ], "This tests the immutability feature"))
     
-    print_step(12, "Performance Test", [
+    parts.append(format_step(12, "Performance Test", [
         "Create multiple files: for i in {1..5}; do echo \"File $i content\" > ./mountpoint/perf_$i.txt; done",
         "Time large file creation: time dd if=/dev/zero of=./mountpoint/large_perf.txt bs=1024 count=10",
         "Monitor system resources during operations"
-    ], "This tests performance with multiple operations")
+    ], "This tests performance with multiple operations"))
     
-    print_step(13, "Log Analysis", [
+    parts.append(format_step(13, "Log Analysis", [
         "Check system logs: tail -f logs.txt",
         "Look for operation logs (READ, WRITE, VERIFY)",
         "Check for any error messages"
-    ], "This verifies logging functionality")
+    ], "This verifies logging functionality"))
     
-    print_step(14, "Cleanup and Unmount", [
+    parts.append(format_step(14, "Cleanup and Unmount", [
         "Stop filesystem: Press Ctrl+C in Terminal 2",
         "Stop IPFS daemon: Press Ctrl+C in Terminal 1",
         "Check mount point: ls ./mountpoint/ (should be empty)",
-        "Verify blockchain file: ls -la blockchain.json"
-    ], "This properly shuts down the system")
+        "Verify blockchain file: ls -la blockchain.bin"
+    ], "This properly shuts down the system"))
     
-    print_header("EXPECTED RESULTS")
+    parts.append(format_header("EXPECTED RESULTS"))
     
-    print("""
+    parts.append("""
 ✅ SUCCESSFUL TEST RESULTS:
    • All files can be created and read correctly
    • Blockchain verification passes
    • File integrity verification passes
    • Logs show all operations
    • No error messages in terminals
-   • Blockchain.json contains valid data
+   • blockchain.bin contains valid data
 
 ❌ POTENTIAL ISSUES:
    • IPFS connection errors → Check IPFS daemon
@@ -145,12 +150,13 @@ FUSE filesystem. Follow each step in order and verify the results.
    • Ensure IPFS daemon is running on localhost:5001
    • Verify all Python dependencies are installed
    • Check that mountpoint directory exists and is empty
-   • Ensure sufficient disk space for blockchain.json
+   • Ensure sufficient disk space for blockchain.bin
+
 """)
     
-    print_header("ADVANCED TESTING")
+    parts.append(format_header("ADVANCED TESTING"))
     
-    print("""
+    parts.append("""
 🚀 ADVANCED TESTS (Optional):
    • Test with very large files (>10MB)
    • Test concurrent file operations
@@ -159,11 +165,15 @@ FUSE filesystem. Follow each step in order and verify the results.
    • Test blockchain corruption detection
    • Performance benchmarking
    • Memory usage monitoring
+
 """)
+    
+    return "".join(parts)
+
+def show_manual_test_guide():
+    """Show complete manual testing guide."""
+    sys.stdout.write(build_manual_test_guide())
 
 # Run the guide when executed
 if __name__ == '__main__':
     show_manual_test_guide()
-
-# Also show when imported
-show_manual_test_guide()
@@ -4,7 +4,73 @@ Quick test script to verify the blockchain filesystem is working.
 
 import os
 import sys
-import subprocess
+
+def load_project():
+    """Make the myfuse modules importable."""
+    if 'myfuse' not in sys.path:
+        sys.path.append('myfuse')
+
+def test_blockchain_operations():
+    """Add a test block and validate the chain."""
+    from blockchain import get_blockchain
+    blockchain = get_blockchain()
+    
+    print(f"   📊 Blockchain has {len(blockchain.chain)} blocks")
+    
+    # Add a test block
+    blockchain.add_block("quick_test.txt", 512, "test_hash_123", "ipfs_test_456")
+    print(f"   ✅ Added test block, now {len(blockchain.chain)} blocks")
+    
+    # Validate
+    is_valid = blockchain.validate_chain()
+    print(f"   🔍 Blockchain valid: {is_valid}")
+
+def test_file_chunking():
+    """Round-trip a chunk through IPFS and verify it."""
+    from ipfs_client import get_ipfs_client, chunk_digest
+    ipfs_client = get_ipfs_client()
+    
+    # Test data
+    test_data = b"This is test data for chunking simulation."
+    print(f"   📄 Test data: {len(test_data)} bytes")
+    
+    # Upload chunk
+    ipfs_hash = ipfs_client.upload_chunk(test_data)
+    print(f"   📤 Uploaded to IPFS: {ipfs_hash}")
+    
+    # Download chunk
+    downloaded = ipfs_client.download_chunk(ipfs_hash)
+    print(f"   📥 Downloaded: {len(downloaded) if downloaded else 0} bytes")
+    
+    # Verify against the same chunk hash the filesystem stores
+    chunk_hash = chunk_digest(test_data)
+    is_valid = ipfs_client.verify_chunk(downloaded, chunk_hash) if downloaded else False
+    print(f"   🔍 Chunk valid: {is_valid}")
+
+def test_integrity_verification():
+    """Show validated blockchain info."""
+    from blockchain import get_blockchain
+    blockchain = get_blockchain()
+    
+    # Get blockchain info
+    info = blockchain.get_blockchain_info(validate=True)
+    print(f"   📊 Total blocks: {info['total_blocks']}")
+    print(f"   📁 Files: {len(info['files'])}")
+    print(f"   ✅ Valid: {info['is_valid']}")
+    
+    # List files
+    if info['files']:
+        print(f"   📋 File list: {list(info['files'])}")
+    else:
+        print("   📋 No files in blockchain yet")
+
+def run_test(name, test):
+    """Run one test in-process and report whether it raised."""
+    try:
+        test()
+        print(f"\n   ✅ {name}: PASSED")
+    except Exception as e:
+        print(f"\n   ❌ {name}: FAILED - {e}")
 
 def quick_test():
     """Run a quick test of the blockchain filesystem."""
@@ -23,106 +89,19 @@ def quick_test():
         return False
     
     print("✅ Project files found, proceeding with tests...")
+    load_project()
     
     # Test 1: Basic blockchain operations
     print("\n1️⃣  Testing Basic Blockchain Operations...")
-    try:
-        result = subprocess.run([
-            sys.executable, '-c', '''
-import sys
-sys.path.append("myfuse")
-from blockchain import blockchain
-
-print(f"   📊 Blockchain has {len(blockchain.chain)} blocks")
-
-# Add a test block
-blockchain.add_block("quick_test.txt", 512, "test_hash_123", "ipfs_test_456")
-print(f"   ✅ Added test block, now {len(blockchain.chain)} blocks")
-
-# Validate
-is_valid = blockchain.validate_chain()
-print(f"   🔍 Blockchain valid: {is_valid}")
-'''
-        ], capture_output=True, text=True, timeout=15)
-        
-        print(result.stdout)
-        if result.returncode == 0:
-            print("   ✅ Basic operations: PASSED")
-        else:
-            print("   ❌ Basic operations: FAILED")
-            print(result.stderr)
-    except Exception as e:
-        print(f"   ❌ Basic operations: ERROR - {e}")
+    run_test("Basic operations", test_blockchain_operations)
     
     # Test 2: File chunking simulation
     print("\n2️⃣  Testing File Chunking...")
-    try:
-        result = subprocess.run([
-            sys.executable, '-c', '''
-import sys
-sys.path.append("myfuse")
-import hashlib
-from ipfs_client import ipfs_client
-
-# Test data
-test_data = b"This is test data for chunking simulation."
-print(f"   📄 Test data: {len(test_data)} bytes")
-
-# Upload chunk
-ipfs_hash = ipfs_client.upload_chunk(test_data)
-print(f"   📤 Uploaded to IPFS: {ipfs_hash}")
-
-# Download chunk
-downloaded = ipfs_client.download_chunk(ipfs_hash)
-print(f"   📥 Downloaded: {len(downloaded) if downloaded else 0} bytes")
-
-# Verify
-chunk_hash = hashlib.sha256(test_data).hexdigest()
-is_valid = ipfs_client.verify_chunk(downloaded, chunk_hash) if downloaded else False
-print(f"   🔍 Chunk valid: {is_valid}")
-'''
-        ], capture_output=True, text=True, timeout=15)
-        
-        print(result.stdout)
-        if result.returncode == 0:
-            print("   ✅ File chunking: PASSED")
-        else:
-            print("   ❌ File chunking: FAILED")
-            print(result.stderr)
-    except Exception as e:
-        print(f"   ❌ File chunking: ERROR - {e}")
+    run_test("File chunking", test_file_chunking)
     
     # Test 3: Integrity verification
     print("\n3️⃣  Testing Integrity Verification...")
-    try:
-        result = subprocess.run([
-            sys.executable, '-c', '''
-import sys
-sys.path.append("myfuse")
-from blockchain import blockchain
-
-# Get blockchain info
-info = blockchain.get_blockchain_info()
-print(f"   📊 Total blocks: {info['total_blocks']}")
-print(f"   📁 Files: {len(info['files'])}")
-print(f"   ✅ Valid: {info['is_valid']}")
-
-# List files
-if info['files']:
-    print(f"   📋 File list: {list(info['files'])}")
-else:
-    print("   📋 No files in blockchain yet")
-'''
-        ], capture_output=True, text=True, timeout=15)
-        
-        print(result.stdout)
-        if result.returncode == 0:
-            print("   ✅ Integrity verification: PASSED")
-        else:
-            print("   ❌ Integrity verification: FAILED")
-            print(result.stderr)
-    except Exception as e:
-        print(f"   ❌ Integrity verification: ERROR - {e}")
+    run_test("Integrity verification", test_integrity_verification)
     
     # Summary
     print("\n" + "=" * 50)
@@ -5,10 +5,11 @@ This script provides step-by-step instructions and automated testing.
 
 import os
 import sys
-import subprocess
 import time
 import signal
 
+import guide_checks
+
 def print_header(title):
     """Print a formatted header."""
     print(f"\n{'='*60}")
@@ -52,37 +53,8 @@ def test_basic_components():
     try:
         # Test blockchain creation
         print("   Creating test blockchain...")
-        result = subprocess.run([
-            sys.executable, '-c', '''
-import sys
-sys.path.append("myfuse")
-from blockchain import Blockchain
-
-# Create test blockchain
-bc = Blockchain("test_chain.json")
-print(f"✅ Blockchain created with {len(bc.chain)} blocks")
-
-# Add test block
-bc.add_block("test.txt", 1024, "abc123", "ipfs_hash_123")
-print(f"✅ Added block, now have {len(bc.chain)} blocks")
-
-# Validate chain
-is_valid = bc.validate_chain()
-print(f"✅ Blockchain validation: {'PASSED' if is_valid else 'FAILED'}")
-
-# Clean up
-import os
-if os.path.exists("test_chain.json"):
-    os.remove("test_chain.json")
-print("✅ Test completed successfully")
-'''
-        ], capture_output=True, text=True, timeout=30)
-        
-        print(result.stdout)
-        if result.stderr:
-            print(f"   ⚠️  Warnings: {result.stderr}")
-        
-        return result.returncode == 0
+        guide_checks.run_basic_components()
+        return True
         
     except Exception as e:
         print(f"   ❌ Component test failed: {e}")
@@ -94,67 +66,8 @@ def test_file_operations():
     
     try:
         print("   Testing file chunking and storage...")
-        result = subprocess.run([
-            sys.executable, '-c', '''
-import sys
-sys.path.append("myfuse")
-import hashlib
-from blockchain import blockchain
-from ipfs_client import ipfs_client
-
-# Test data
-test_data = b"Hello, blockchain world! This is a test file for chunking."
-chunk_size = 32  # Small chunks for testing
-
-print(f"📄 Test data: {len(test_data)} bytes")
-
-# Split into chunks
-chunks = []
-for i in range(0, len(test_data), chunk_size):
-    chunk = test_data[i:i + chunk_size]
-    chunks.append(chunk)
-
-print(f"📦 Split into {len(chunks)} chunks")
-
-# Process each chunk
-filename = "test_file.txt"
-for i, chunk in enumerate(chunks):
-    chunk_hash = hashlib.sha256(chunk).hexdigest()
-    ipfs_hash = ipfs_client.upload_chunk(chunk)
-    
-    # Add to blockchain
-    block = blockchain.add_block(filename, len(chunk), chunk_hash, ipfs_hash)
-    print(f"   ✅ Chunk {i+1}: {len(chunk)} bytes -> Block {block.index}")
-
-# Verify file blocks
-file_blocks = blockchain.get_file_blocks(filename)
-print(f"📋 File has {len(file_blocks)} blocks in blockchain")
-
-# Test reconstruction
-reconstructed = b""
-for block in sorted(file_blocks, key=lambda b: b.index):
-    chunk_data = ipfs_client.download_chunk(block.ipfs_hash)
-    if chunk_data and ipfs_client.verify_chunk(chunk_data, block.chunk_hash):
-        reconstructed += chunk_data
-        print(f"   ✅ Chunk {block.index} verified and reconstructed")
-    else:
-        print(f"   ❌ Chunk {block.index} verification failed")
-
-# Verify reconstruction
-if reconstructed == test_data:
-    print("🎉 File reconstruction successful!")
-else:
-    print("❌ File reconstruction failed!")
-    print(f"   Original: {test_data}")
-    print(f"   Reconstructed: {reconstructed}")
-'''
-        ], capture_output=True, text=True, timeout=30)
-        
-        print(result.stdout)
-        if result.stderr:
-            print(f"   ⚠️  Warnings: {result.stderr}")
-        
-        return result.returncode == 0
+        guide_checks.run_file_operations()
+        return True
         
     except Exception as e:
         print(f"   ❌ File operations test failed: {e}")
@@ -166,54 +79,8 @@ def test_integrity_verification():
     
     try:
         print("   Testing blockchain integrity...")
-        result = subprocess.run([
-            sys.executable, '-c', '''
-import sys
-sys.path.append("myfuse")
-from blockchain import blockchain
-
-# Check current blockchain
-print(f"📊 Current blockchain: {len(blockchain.chain)} blocks")
-
-# Validate blockchain
-is_valid = blockchain.validate_chain()
-print(f"🔍 Blockchain validation: {'✅ VALID' if is_valid else '❌ INVALID'}")
-
-# Get blockchain info
-info = blockchain.get_blockchain_info()
-print(f"📈 Blockchain info:")
-print(f"   Total blocks: {info['total_blocks']}")
-print(f"   Files: {len(info['files'])}")
-print(f"   Valid: {info['is_valid']}")
-
-# List files
-files = set()
-for block in blockchain.chain:
-    if block.filename != "GENESIS":
-        files.add(block.filename)
-
-if files:
-    print(f"📁 Files in blockchain: {list(files)}")
-    
-    # Test tampering detection for each file
-    for filename in files:
-        tampered = blockchain.detect_tampering(filename)
-        if tampered:
-            print(f"   ⚠️  {filename}: Tampering detected in blocks {tampered}")
-        else:
-            print(f"   ✅ {filename}: No tampering detected")
-else:
-    print("📁 No files in blockchain yet")
-
-print("🎉 Integrity verification completed!")
-'''
-        ], capture_output=True, text=True, timeout=30)
-        
-        print(result.stdout)
-        if result.stderr:
-            print(f"   ⚠️  Warnings: {result.stderr}")
-        
-        return result.returncode == 0
+        guide_checks.run_integrity_verification()
+        return True
         
     except Exception as e:
         print(f"   ❌ Integrity verification test failed: {e}")
@@ -253,15 +120,15 @@ def show_manual_testing_guide():
    python -c "
    import sys; sys.path.append('myfuse')
    from blockchain import blockchain
-   files = set(b.filename for b in blockchain.chain if b.filename != 'GENESIS')
-   print('Files:', list(files))
+   print('Files:', blockchain.get_filenames())
    "
 
 5️⃣  VIEW LOGS:
    cat logs.txt
 
 6️⃣  VIEW BLOCKCHAIN DATA:
-   cat blockchain.json | python -m json.tool
+   python myfuse/integrity_checker.py export-json
+   python -m json.tool blockchain.json
 """)
 
 def show_fuse_testing_guide():
@@ -347,7 +214,7 @@ def show_advanced_testing():
    tail -f logs.txt
    
    # Monitor blockchain growth
-   watch -n 1 'wc -l blockchain.json'
+   watch -n 1 'ls -l blockchain.bin'
    
    # Check system resources
    top -p $(pgrep -f "python.*main.py")
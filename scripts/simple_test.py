@@ -3,11 +3,21 @@ Simple test script for the blockchain FUSE filesystem.
 This script tests the filesystem by creating files and verifying operations.
 """
 
+import io
 import os
 import sys
 import time
-import subprocess
 import json
+from contextlib import redirect_stdout
+
+if 'myfuse' not in sys.path:
+    sys.path.append('myfuse')
+from config import CHUNK_SIZE
+
+# Contents written and read back by the tests, built once
+SMALL_CONTENT = b"Hello, blockchain world! This is a test."
+LARGE_CONTENT = b"A" * CHUNK_SIZE + b"B" * CHUNK_SIZE + b"C" * CHUNK_SIZE  # 3 chunks
+BINARY_CONTENT = bytes(range(256)) * 2  # 512 bytes
 
 class SimpleFilesystemTester:
     """Simple tester that works with the mounted filesystem directly."""
@@ -15,7 +25,22 @@ class SimpleFilesystemTester:
     def __init__(self, mount_point="./mountpoint"):
         self.mount_point = mount_point
         self.test_files = []
-        
+        self._checker = None
+    
+    def integrity_checker(self):
+        """Import the integrity checker in-process on first use and reuse it."""
+        if self._checker is None:
+            from integrity_checker import IntegrityChecker
+            self._checker = IntegrityChecker()
+        return self._checker
+    
+    def run_checker(self, check, *args):
+        """Run an integrity checker method, returning (result, captured output)."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            result = check(*args)
+        return result, output.getvalue().strip()
+    
     def check_mount_point(self):
         """Check if the mount point exists and is accessible."""
         if not os.path.exists(self.mount_point):
@@ -34,12 +59,11 @@ class SimpleFilesystemTester:
         """Test writing a small file."""
         print("\n📝 Testing small file write...")
         
-        test_content = "Hello, blockchain world! This is a test."
         test_file = os.path.join(self.mount_point, "test_small.txt")
         
         try:
-            with open(test_file, 'w') as f:
-                f.write(test_content)
+            with open(test_file, 'wb') as f:
+                f.write(SMALL_CONTENT)
             
             print("✅ Small file written successfully")
             self.test_files.append("test_small.txt")
@@ -54,20 +78,19 @@ class SimpleFilesystemTester:
         print("\n📖 Testing small file read...")
         
         test_file = os.path.join(self.mount_point, "test_small.txt")
-        expected_content = "Hello, blockchain world! This is a test."
         
         try:
-            with open(test_file, 'r') as f:
+            with open(test_file, 'rb') as f:
                 content = f.read()
             
-            if content == expected_content:
+            if content == SMALL_CONTENT:
                 print("✅ Small file read successfully")
-                print(f"   Content: {content[:50]}...")
+                print(f"   Content: {content[:50].decode(errors='replace')}...")
                 return True
             else:
                 print("❌ Content mismatch")
-                print(f"   Expected: {expected_content[:50]}...")
-                print(f"   Got: {content[:50]}...")
+                print(f"   Expected: {SMALL_CONTENT[:50].decode()}...")
+                print(f"   Got: {content[:50].decode(errors='replace')}...")
                 return False
                 
         except Exception as e:
@@ -78,15 +101,13 @@ class SimpleFilesystemTester:
         """Test writing a larger file (multiple chunks)."""
         print("\n📦 Testing large file write...")
         
-        # Create 3KB of test data (3 chunks)
-        test_content = "A" * 1024 + "B" * 1024 + "C" * 1024
         test_file = os.path.join(self.mount_point, "test_large.txt")
         
         try:
-            with open(test_file, 'w') as f:
-                f.write(test_content)
+            with open(test_file, 'wb') as f:
+                f.write(LARGE_CONTENT)
             
-            print(f"✅ Large file written successfully ({len(test_content)} bytes)")
+            print(f"✅ Large file written successfully ({len(LARGE_CONTENT)} bytes)")
             self.test_files.append("test_large.txt")
             return True
             
@@ -99,19 +120,18 @@ class SimpleFilesystemTester:
         print("\n📖 Testing large file read...")
         
         test_file = os.path.join(self.mount_point, "test_large.txt")
-        expected_content = "A" * 1024 + "B" * 1024 + "C" * 1024
         
         try:
-            with open(test_file, 'r') as f:
+            with open(test_file, 'rb') as f:
                 content = f.read()
             
-            if content == expected_content and len(content) == 3072:
+            if content == LARGE_CONTENT:
                 print("✅ Large file read successfully")
                 print(f"   Size: {len(content)} bytes")
                 return True
             else:
                 print("❌ Large file content mismatch")
-                print(f"   Expected size: {len(expected_content)}")
+                print(f"   Expected size: {len(LARGE_CONTENT)}")
                 print(f"   Actual size: {len(content)}")
                 return False
                 
@@ -123,21 +143,19 @@ class SimpleFilesystemTester:
         """Test writing and reading a binary file."""
         print("\n🔢 Testing binary file operations...")
         
-        # Create binary test data
-        test_data = bytes(range(256)) * 2  # 512 bytes
         test_file = os.path.join(self.mount_point, "test_binary.bin")
         
         try:
             # Write binary file
             with open(test_file, 'wb') as f:
-                f.write(test_data)
+                f.write(BINARY_CONTENT)
             
             # Read it back
             with open(test_file, 'rb') as f:
                 read_data = f.read()
             
-            if read_data == test_data:
-                print(f"✅ Binary file operations successful ({len(test_data)} bytes)")
+            if read_data == BINARY_CONTENT:
+                print(f"✅ Binary file operations successful ({len(BINARY_CONTENT)} bytes)")
                 self.test_files.append("test_binary.bin")
                 return True
             else:
@@ -207,22 +225,18 @@ class SimpleFilesystemTester:
         
         try:
             # Run the integrity checker
-            result = subprocess.run([
-                sys.executable, 'myfuse/integrity_checker.py', 'verify-blockchain'
-            ], capture_output=True, text=True, timeout=30)
+            checker = self.integrity_checker()
+            is_valid, output = self.run_checker(checker.verify_blockchain)
             
-            if result.returncode == 0:
+            if is_valid:
                 print("✅ Blockchain verification successful")
-                print("   Output:", result.stdout.strip().split('\n')[-1])
+                print("   Output:", output.split('\n')[-1])
                 return True
             else:
                 print("❌ Blockchain verification failed")
-                print("   Error:", result.stderr.strip())
+                print("   Error:", output)
                 return False
                 
-        except subprocess.TimeoutExpired:
-            print("❌ Blockchain verification timed out")
-            return False
         except Exception as e:
             print(f"❌ Blockchain verification error: {e}")
             return False
@@ -239,21 +253,17 @@ class SimpleFilesystemTester:
         test_file = self.test_files[0]
         
         try:
-            result = subprocess.run([
-                sys.executable, 'myfuse/integrity_checker.py', 'verify-file', '--file', test_file
-            ], capture_output=True, text=True, timeout=30)
+            checker = self.integrity_checker()
+            is_valid, output = self.run_checker(checker.verify_file, test_file)
             
-            if result.returncode == 0:
+            if is_valid:
                 print(f"✅ File verification successful for {test_file}")
                 return True
             else:
                 print(f"❌ File verification failed for {test_file}")
-                print("   Error:", result.stderr.strip())
+                print("   Error:", output)
                 return False
                 
-        except subprocess.TimeoutExpired:
-            print("❌ File verification timed out")
-            return False
         except Exception as e:
             print(f"❌ File verification error: {e}")
             return False
@@ -15,6 +15,7 @@ try:
     from myfuse.blockchain import blockchain
     from myfuse.ipfs_client import ipfs_client
     from myfuse.integrity_checker import IntegrityChecker
+    from myfuse.config import CHUNK_SIZE
 except ImportError:
     # Alternative import method if direct import fails
     import importlib.util
@@ -29,10 +30,12 @@ except ImportError:
     blockchain_module = load_module("blockchain", "myfuse/blockchain.py")
     ipfs_module = load_module("ipfs_client", "myfuse/ipfs_client.py")
     checker_module = load_module("integrity_checker", "myfuse/integrity_checker.py")
+    config_module = load_module("config", "myfuse/config.py")
     
     blockchain = blockchain_module.blockchain
     ipfs_client = ipfs_module.ipfs_client
     IntegrityChecker = checker_module.IntegrityChecker
+    CHUNK_SIZE = config_module.CHUNK_SIZE
 
 class FilesystemTester:
     """Comprehensive tester for the blockchain FUSE filesystem."""
@@ -89,8 +92,8 @@ class FilesystemTester:
         """Test writing and reading a large file (multiple chunks)."""
         print("\n📦 Testing large file operations...")
         
-        # Create 5KB of test data (5 chunks)
-        test_content = "A" * 1024 + "B" * 1024 + "C" * 1024 + "D" * 1024 + "E" * 1024
+        # Create 5 chunks of test data
+        test_content = "A" * CHUNK_SIZE + "B" * CHUNK_SIZE + "C" * CHUNK_SIZE + "D" * CHUNK_SIZE + "E" * CHUNK_SIZE
         test_file = os.path.join(self.mount_point, "large_test.txt")
         
         try:
@@ -356,7 +356,7 @@ def main():
             print("\n🎉 Setup verification completed successfully!")
             print("\n🎯 You can now run:")
             print("   python scripts/quick_test.py")
-            print("   python scripts/demo.py")
+            print("   python scripts/demo.py --slow")
             print("   python scripts/run_guide.py")
             return True
         else:
@@ -0,0 +1,90 @@
+"""
+Tests for the block log and chain validation in myfuse/blockchain.py.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'myfuse'))
+
+from blockchain import RECORD_LENGTH, Blockchain
+
+def test_reader_leaves_partial_tail_untouched(tmp_path):
+    """Loading a log that ends mid-record must not modify the file."""
+    path = str(tmp_path / 'chain.bin')
+    writer = Blockchain(path)
+    writer.add_block("a.txt", 3, "0" * 64, "QmA")
+    
+    # Simulate an append that is still in progress
+    with open(path, 'ab') as f:
+        f.write(b'\x40\x00\x00\x00partial')
+    size = os.path.getsize(path)
+    
+    reader = Blockchain(path)
+    
+    assert len(reader.chain) == 2
+    assert os.path.getsize(path) == size
+
+def test_writer_repairs_partial_tail_on_append(tmp_path):
+    """The next append cuts off a partial record before writing."""
+    path = str(tmp_path / 'chain.bin')
+    Blockchain(path).add_block("a.txt", 3, "0" * 64, "QmA")
+    with open(path, 'ab') as f:
+        f.write(b'\x40\x00\x00\x00partial')
+    
+    writer = Blockchain(path)
+    writer.add_block("b.txt", 4, "1" * 64, "QmB")
+    
+    reloaded = Blockchain(path)
+    assert [block.filename for block in reloaded.chain] == ["GENESIS", "a.txt", "b.txt"]
+    assert reloaded.validate_chain()
+
+def test_corrupt_record_raises_and_leaves_log_untouched(tmp_path):
+    """A record that fails to decode must not be replaced by a fresh chain."""
+    path = str(tmp_path / 'chain.bin')
+    chain = Blockchain(path)
+    chain.add_block("a.txt", 3, "0" * 64, "QmA")
+    chain.add_block("b.txt", 4, "1" * 64, "QmB")
+    
+    with open(path, 'rb') as f:
+        data = bytearray(f.read())
+    data[data.index(b'a.txt')] = 0xff
+    with open(path, 'wb') as f:
+        f.write(data)
+    
+    with pytest.raises(ValueError):
+        Blockchain(path)
+    with open(path, 'rb') as f:
+        assert f.read() == data
+
+def test_corrupt_length_mid_log_is_not_a_torn_tail(tmp_path):
+    """A bad length prefix before complete records must not be treated as the end of the log."""
+    path = str(tmp_path / 'chain.bin')
+    chain = Blockchain(path)
+    chain.add_block("a.txt", 3, "0" * 64, "QmA")
+    chain.add_block("b.txt", 4, "1" * 64, "QmB")
+    size = os.path.getsize(path)
+    
+    # Point the second record's length prefix past the end of the file
+    with open(path, 'r+b') as f:
+        (first_length,) = RECORD_LENGTH.unpack(f.read(RECORD_LENGTH.size))
+        f.seek(RECORD_LENGTH.size + first_length)
+        f.write(RECORD_LENGTH.pack(size))
+    
+    with pytest.raises(ValueError):
+        Blockchain(path)
+    assert os.path.getsize(path) == size
+
+def test_tampering_after_validation_is_detected(tmp_path):
+    """Changing a block after it was validated must still be caught."""
+    chain = Blockchain(str(tmp_path / 'chain.bin'))
+    block = chain.add_block("a.txt", 3, "0" * 64, "QmA")
+    assert chain.validate_chain()
+    assert chain.detect_tampering("a.txt") == []
+    
+    block.file_size = 4
+    
+    assert not chain.validate_chain()
+    assert chain.detect_tampering("a.txt") == [block.index]